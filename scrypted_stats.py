@@ -1,125 +1,435 @@
 #!/usr/bin/env python3
+import http.client
+import json
+import logging
+import mmap
+import operator
 import os
+import re
+import socket
+import sqlite3
 import subprocess
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
 
+# Optional inotify support - falls back to mtime scans when unavailable
+try:
+    from inotify_simple import INotify, flags as inotify_flags
+    INOTIFY_AVAILABLE = True
+except ImportError:
+    INOTIFY_AVAILABLE = False
+
+logger = logging.getLogger(__name__)
+
 CAMERA_NAMES = {'46': 'IPC-F22', '27': 'IPC-G22'}
 
-def get_scrypted_cameras():
+# Cache for the combined stats (dashboard polls faster than the tree changes)
+STATS_CACHE = {'time': 0, 'data': None}
+CACHE_DURATION = 15
+
+RECORDINGS_BASE = '/scrypted/nvr/recordings'
+CAMERA_DIR_PREFIX = 'scrypted-'
+CAMERA_DIR_PREFIX_LEN = len(CAMERA_DIR_PREFIX)
+
+def _walk_subtree(path, since):
+    """Walk one subtree; return (recent_count, [(json_path, mtime)], rtsp+json total)"""
+    recent = 0
+    jsons = []
+    total = 0
+    try:
+        for entry in os.scandir(path):
+            if entry.is_dir(follow_symlinks=False):
+                sub_recent, sub_jsons, sub_total = _walk_subtree(entry.path, since)
+                recent += sub_recent
+                jsons.extend(sub_jsons)
+                total += sub_total
+                continue
+            try:
+                mtime = entry.stat(follow_symlinks=False).st_mtime
+            except OSError:
+                continue
+            name = entry.name
+            is_json = name.endswith('.json')
+            if is_json or name.endswith('.rtsp'):
+                total += 1
+            if is_json:
+                jsons.append((entry.path, mtime))
+            if mtime >= since:
+                recent += 1
+    except OSError:
+        pass
+    return recent, jsons, total
+
+def _scan_recordings():
+    """One shared walk of the recordings tree feeding cameras/events/storage.
+
+    Returns {'time', 'cameras': {id: recent_count}, 'jsons': [(path, mtime)],
+    'total': rtsp+json file count}.
+    """
+    now = time.time()
+    since = now - 300
+    scan = {'time': now, 'cameras': {}, 'jsons': [], 'total': 0}
+    jobs = []
+    try:
+        for entry in os.scandir(RECORDINGS_BASE):
+            if entry.is_dir(follow_symlinks=False):
+                camera_id = entry.name[CAMERA_DIR_PREFIX_LEN:] if entry.name.startswith(CAMERA_DIR_PREFIX) else None
+                jobs.append((camera_id, entry.path))
+    except OSError:
+        return scan
+
+    if not jobs:
+        return scan
+
+    # Subtrees are independent, so walk them in parallel
+    with ThreadPoolExecutor(max_workers=min(8, len(jobs))) as executor:
+        futures = [executor.submit(_walk_subtree, path, since) for _, path in jobs]
+        for (camera_id, _), future in zip(jobs, futures):
+            try:
+                recent, jsons, total = future.result(timeout=5)
+            except Exception:
+                continue
+            if camera_id is not None:
+                scan['cameras'][camera_id] = scan['cameras'].get(camera_id, 0) + recent
+            scan['jsons'].extend(jsons)
+            scan['total'] += total
+    return scan
+
+class _RecordingWatcher:
+    """Track per-camera write activity via inotify instead of rescanning mtimes"""
+
+    def __init__(self, base):
+        self.base = base
+        self.inotify = INotify()
+        self.watch_flags = (inotify_flags.CREATE | inotify_flags.MODIFY |
+                            inotify_flags.CLOSE_WRITE)
+        self.watches = {}  # wd -> (camera_id, dir_path)
+        self.events = {}   # camera_id -> recent event timestamps
+        self.lock = threading.Lock()
+        self.started = time.time()
+        self.base_wd = self.inotify.add_watch(base, self.watch_flags)
+        self.watches[self.base_wd] = (None, base)
+        for entry in os.scandir(base):
+            if entry.is_dir(follow_symlinks=False) and entry.name.startswith(CAMERA_DIR_PREFIX):
+                self._watch_subtree(entry.path, entry.name[CAMERA_DIR_PREFIX_LEN:])
+
+    def _watch_subtree(self, path, camera_id):
+        try:
+            wd = self.inotify.add_watch(path, self.watch_flags)
+            self.watches[wd] = (camera_id, path)
+            for entry in os.scandir(path):
+                if entry.is_dir(follow_symlinks=False):
+                    self._watch_subtree(entry.path, camera_id)
+        except OSError:
+            pass
+
+    def run(self):
+        while True:
+            for event in self.inotify.read():
+                camera_id, dir_path = self.watches.get(event.wd, (None, None))
+                if event.mask & inotify_flags.ISDIR:
+                    # New directory appeared - extend the watch tree
+                    if dir_path is None:
+                        continue
+                    child = os.path.join(dir_path, event.name)
+                    if event.wd == self.base_wd:
+                        if event.name.startswith(CAMERA_DIR_PREFIX):
+                            self._watch_subtree(child, event.name[CAMERA_DIR_PREFIX_LEN:])
+                    elif camera_id is not None:
+                        self._watch_subtree(child, camera_id)
+                    continue
+                if camera_id is None:
+                    continue
+                now = time.time()
+                with self.lock:
+                    self.events.setdefault(camera_id, []).append(now)
+
+    def recent_counts(self):
+        """Per-camera count of write events in the last 5 minutes"""
+        cutoff = time.time() - 300
+        counts = {}
+        with self.lock:
+            for camera_id, times in self.events.items():
+                times[:] = [t for t in times if t >= cutoff]
+                counts[camera_id] = len(times)
+        return counts
+
+RECORDING_WATCHER = None
+RECORDING_WATCHER_FAILED = False
+
+def _get_recording_watcher():
+    """Start the inotify watcher on first use; None if unsupported"""
+    global RECORDING_WATCHER, RECORDING_WATCHER_FAILED
+    if RECORDING_WATCHER is not None or RECORDING_WATCHER_FAILED or not INOTIFY_AVAILABLE:
+        return RECORDING_WATCHER
+    try:
+        watcher = _RecordingWatcher(RECORDINGS_BASE)
+        threading.Thread(target=watcher.run, daemon=True).start()
+        RECORDING_WATCHER = watcher
+    except OSError:
+        RECORDING_WATCHER_FAILED = True
+    return RECORDING_WATCHER
+
+def get_scrypted_cameras(scan=None):
     cameras = []
-    recordings_base = '/scrypted/nvr/recordings'
     try:
-        for item in os.listdir(recordings_base):
-            if item.startswith('scrypted-'):
-                camera_id = item.replace('scrypted-', '')
-                camera_path = os.path.join(recordings_base, item)
-                camera_name = CAMERA_NAMES.get(camera_id, f'Camera {camera_id}')
-                
-                # Check if recording by looking for recent files
-                is_recording = False
-                file_count = 0
-                try:
-                    # Count files modified in the last 5 minutes
-                    result = subprocess.run(
-                        ['find', camera_path, '-type', 'f', '-mmin', '-5'],
-                        capture_output=True, text=True, timeout=3
-                    )
-                    recent_files = result.stdout.strip().split('\n') if result.stdout.strip() else []
-                    file_count = len(recent_files)
-                    is_recording = file_count > 0
-                except:
-                    pass
-                
-                cameras.append({
-                    'id': camera_id,
-                    'name': camera_name,
-                    'recording': is_recording,
-                    'recording_count': file_count,
-                    'last_recording': 'Active' if is_recording else 'Idle'
-                })
-        
-        cameras.sort(key=lambda x: int(x['id']))
-        return {'cameras': cameras, 'total': len(cameras), 'recording': sum(1 for c in cameras if c['recording'])}
-    except:
+        if scan is None:
+            scan = _scan_recordings()
+
+        # Once the watcher has run for a full activity window, its event
+        # counts replace the mtime-derived ones
+        watcher = _get_recording_watcher()
+        counts = dict(scan['cameras'])
+        if watcher is not None and (time.time() - watcher.started) > 300:
+            watcher_counts = watcher.recent_counts()
+            for camera_id in counts:
+                counts[camera_id] = watcher_counts.get(camera_id, 0)
+
+        recording = 0
+        for camera_id, file_count in counts.items():
+            camera_name = CAMERA_NAMES.get(camera_id, f'Camera {camera_id}')
+            is_recording = file_count > 0
+            if is_recording:
+                recording += 1
+            cameras.append({
+                'id': camera_id,
+                'name': camera_name,
+                'recording': is_recording,
+                'recording_count': file_count,
+                'last_recording': 'Active' if is_recording else 'Idle',
+                '_sortkey': int(camera_id) if camera_id.isdigit() else 0
+            })
+
+        # Sort on the precomputed key instead of re-parsing ids per comparison
+        cameras.sort(key=operator.itemgetter('_sortkey'))
+        for camera in cameras:
+            del camera['_sortkey']
+        return {'cameras': cameras, 'total': len(cameras), 'recording': recording}
+    except (OSError, ValueError) as e:
+        logger.debug('camera probe failed', exc_info=e)
         return {'cameras': [], 'total': 0, 'recording': 0}
 
-def get_scrypted_events():
-    # Count events from today
-    today = datetime.now().strftime('%Y-%m-%d')
+def _contains_object_detector(path):
+    """Check a JSON file for the ObjectDetector marker without spawning grep"""
+    try:
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            if size == 0:
+                return False
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as m:
+                return m.find(b'ObjectDetector') != -1
+    except OSError:
+        return False
+
+# Incremental event index: JSONs are scanned for the ObjectDetector marker
+# once and remembered, so each poll only reads new or changed files
+EVENTS_DB_PATH = os.getenv('SCRYPTED_EVENTS_DB', '/var/cache/scrypted_events.db')
+
+_events_db = None
+_events_db_lock = threading.Lock()
+
+def _get_events_db():
+    global _events_db
+    if _events_db is None:
+        try:
+            os.makedirs(os.path.dirname(EVENTS_DB_PATH), exist_ok=True)
+            conn = sqlite3.connect(EVENTS_DB_PATH, check_same_thread=False)
+        except (OSError, sqlite3.Error):
+            # No writable cache dir - index still works, just not persistent
+            conn = sqlite3.connect(':memory:', check_same_thread=False)
+        conn.execute(
+            'CREATE TABLE IF NOT EXISTS events (path TEXT PRIMARY KEY, mtime REAL, has_obj INTEGER)'
+        )
+        conn.commit()
+        _events_db = conn
+    return _events_db
+
+_LAST_TREE_MTIME = {'value': None}
+
+def _recordings_tree_mtime():
+    """Max mtime over the recordings root and its camera dirs - a cheap dirty bit"""
+    try:
+        latest = os.stat(RECORDINGS_BASE).st_mtime
+        for entry in os.scandir(RECORDINGS_BASE):
+            if entry.is_dir(follow_symlinks=False):
+                mtime = entry.stat(follow_symlinks=False).st_mtime
+                if mtime > latest:
+                    latest = mtime
+        return latest
+    except OSError:
+        return None
+
+def get_scrypted_events(scan=None):
     today_events = 0
     week_events = 0
-    
+
     try:
-        # Quick check: count JSON files with ObjectDetector events from last 24 hours
-        result = subprocess.run(
-            ['find', '/scrypted/nvr/recordings', '-name', '*.json', '-mtime', '-1', '-exec', 
-             'grep', '-l', 'ObjectDetector', '{}', '+'],
-            capture_output=True, text=True, timeout=5
-        )
-        files = result.stdout.strip().split('\n') if result.stdout.strip() else []
-        today_events = len(files)
-        
-        # Week events
-        result = subprocess.run(
-            ['find', '/scrypted/nvr/recordings', '-name', '*.json', '-mtime', '-7', '-exec', 
-             'grep', '-l', 'ObjectDetector', '{}', '+'],
-            capture_output=True, text=True, timeout=5
-        )
-        files = result.stdout.strip().split('\n') if result.stdout.strip() else []
-        week_events = len(files)
-    except:
-        pass
-    
+        now = time.time()
+        if scan is None:
+            # Standalone call: skip the tree walk entirely when the dirty
+            # bit says nothing changed - the SQL counts age out on their own
+            tree_mtime = _recordings_tree_mtime()
+            if tree_mtime is not None and tree_mtime == _LAST_TREE_MTIME['value']:
+                scan = {'time': now, 'jsons': []}
+            else:
+                scan = _scan_recordings()
+                _LAST_TREE_MTIME['value'] = tree_mtime
+        else:
+            _LAST_TREE_MTIME['value'] = _recordings_tree_mtime()
+
+        week_cutoff = scan['time'] - 7 * 86400
+        today_cutoff = scan['time'] - 86400
+
+        db = _get_events_db()
+        with _events_db_lock:
+            indexed = dict(db.execute('SELECT path, mtime FROM events'))
+
+        # Only files the index has not seen (or whose mtime moved) get read
+        pending = [(path, mtime) for path, mtime in scan['jsons']
+                   if mtime >= week_cutoff and indexed.get(path) != mtime]
+
+        if pending:
+            # Scan the files in-process (mmap + bytes.find) - grep startup
+            # dominates for small JSONs; parallel threads overlap the I/O
+            with ThreadPoolExecutor(max_workers=min(16, len(pending))) as executor:
+                hits = list(executor.map(_contains_object_detector,
+                                         [path for path, _ in pending]))
+            with _events_db_lock:
+                db.executemany(
+                    'INSERT OR REPLACE INTO events VALUES (?, ?, ?)',
+                    [(path, mtime, int(hit)) for (path, mtime), hit in zip(pending, hits)]
+                )
+                db.execute('DELETE FROM events WHERE mtime < ?', (week_cutoff,))
+                db.commit()
+
+        with _events_db_lock:
+            week_events = db.execute(
+                'SELECT COUNT(*) FROM events WHERE has_obj = 1 AND mtime >= ?',
+                (week_cutoff,)
+            ).fetchone()[0]
+            today_events = db.execute(
+                'SELECT COUNT(*) FROM events WHERE has_obj = 1 AND mtime >= ?',
+                (today_cutoff,)
+            ).fetchone()[0]
+    except (OSError, sqlite3.Error, ValueError) as e:
+        logger.debug('events probe failed', exc_info=e)
+
     return {'today': today_events, 'week': week_events}
 
-def get_scrypted_storage():
+# du walks the whole recordings tree, so refresh it on a much longer TTL
+DU_CACHE = {'time': 0, 'size': 'N/A'}
+DU_CACHE_DURATION = 300
+
+def get_scrypted_storage(scan=None):
     try:
-        result = subprocess.run(['du', '-sh', '/scrypted/nvr/recordings'], 
-                                capture_output=True, text=True, timeout=3)
-        size = result.stdout.split()[0] if result.returncode == 0 else 'N/A'
-        
-        # Count total recording files (all .rtsp and .json files)
-        file_count = 0
-        try:
-            result = subprocess.run(
-                ['find', '/scrypted/nvr/recordings', '-type', 'f', '(', '-name', '*.rtsp', '-o', '-name', '*.json', ')'],
-                capture_output=True, text=True, timeout=5
-            )
-            files = result.stdout.strip().split('\n') if result.stdout.strip() else []
-            file_count = len(files)
-        except:
-            pass
-        
-        return {'size': size, 'files': file_count}
-    except:
+        now = time.monotonic()
+        if (now - DU_CACHE['time']) >= DU_CACHE_DURATION or DU_CACHE['size'] == 'N/A':
+            result = subprocess.run(['du', '-sh', RECORDINGS_BASE],
+                                    capture_output=True, timeout=3)
+            if result.returncode == 0 and result.stdout:
+                DU_CACHE['size'] = result.stdout.split()[0].decode()
+                DU_CACHE['time'] = now
+
+        # File count (all .rtsp and .json) comes free with the shared walk
+        if scan is None:
+            scan = _scan_recordings()
+
+        return {'size': DU_CACHE['size'], 'files': scan['total']}
+    except (OSError, subprocess.SubprocessError, ValueError) as e:
+        logger.debug('storage probe failed', exc_info=e)
         return {'size': 'N/A', 'files': 0}
 
+DOCKER_SOCKET = '/var/run/docker.sock'
+
+class _DockerSocketConnection(http.client.HTTPConnection):
+    """HTTP connection over the Docker daemon's UNIX socket"""
+    def __init__(self, timeout=2):
+        super().__init__('localhost', timeout=timeout)
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(DOCKER_SOCKET)
+
+_docker_conn = None
+
+def _docker_api_get(path):
+    """GET a Docker Engine API path, reusing one persistent connection"""
+    global _docker_conn
+    for attempt in range(2):
+        try:
+            if _docker_conn is None:
+                _docker_conn = _DockerSocketConnection()
+            _docker_conn.request('GET', path)
+            response = _docker_conn.getresponse()
+            body = response.read()
+            if response.status != 200:
+                return None
+            return json.loads(body)
+        except (OSError, http.client.HTTPException, ValueError):
+            # Stale connection - drop it and retry once with a fresh one
+            try:
+                if _docker_conn:
+                    _docker_conn.close()
+            except Exception:
+                pass
+            _docker_conn = None
+    return None
+
+# StartedAt rarely changes, so remember the parse keyed on the raw string
+_START_TIME_CACHE = {'raw': None, 'epoch': 0.0, 'started': 'N/A'}
+
 def get_scrypted_container_stats():
     try:
-        result = subprocess.run(['docker', 'inspect', 'scrypted', '--format', '{{.State.Status}}|{{.State.StartedAt}}'], 
-                                capture_output=True, text=True, timeout=2)
-        if result.returncode == 0:
-            status, started_at = result.stdout.strip().split('|')
-            start_time = datetime.fromisoformat(started_at.replace('Z', '+00:00'))
-            uptime_seconds = (datetime.now(start_time.tzinfo) - start_time).total_seconds()
-            days = int(uptime_seconds // 86400)
-            hours = int((uptime_seconds % 86400) // 3600)
-            minutes = int((uptime_seconds % 3600) // 60)
-            return {'status': status, 'uptime': f"{days}d {hours}h {minutes}m", 'started': start_time.strftime('%Y-%m-%d %H:%M:%S')}
+        # Query the daemon directly - forking the docker CLI costs far more
+        # than the inspect itself
+        info = _docker_api_get('/containers/scrypted/json')
+        if info:
+            status = info.get('State', {}).get('Status', 'unknown')
+            started_at = info.get('State', {}).get('StartedAt', '')
+            if started_at != _START_TIME_CACHE['raw']:
+                # Engine API timestamps carry nanoseconds; trim to
+                # microseconds so fromisoformat can parse them
+                trimmed = re.sub(r'(\.\d{6})\d*', r'\1', started_at)
+                start_time = datetime.fromisoformat(trimmed.replace('Z', '+00:00'))
+                _START_TIME_CACHE['raw'] = started_at
+                _START_TIME_CACHE['epoch'] = start_time.timestamp()
+                _START_TIME_CACHE['started'] = start_time.strftime('%Y-%m-%d %H:%M:%S')
+            uptime_seconds = int(time.time() - _START_TIME_CACHE['epoch'])
+            days, rem = divmod(uptime_seconds, 86400)
+            hours, rem = divmod(rem, 3600)
+            minutes = rem // 60
+            return {'status': status, 'uptime': f"{days}d {hours}h {minutes}m", 'started': _START_TIME_CACHE['started']}
         return {'status': 'unknown', 'uptime': 'N/A', 'started': 'N/A'}
-    except:
+    except (OSError, ValueError, KeyError) as e:
+        logger.debug('container probe failed', exc_info=e)
         return {'status': 'error', 'uptime': 'N/A', 'started': 'N/A'}
 
 def get_all_scrypted_stats():
     # Collect real Scrypted stats (cameras, events, storage, container)
+    now = time.monotonic()
+    if STATS_CACHE['data'] and (now - STATS_CACHE['time']) < CACHE_DURATION:
+        return STATS_CACHE['data']
+
     try:
-        return {
-            'cameras': get_scrypted_cameras(),
-            'events': get_scrypted_events(),
-            'storage': get_scrypted_storage(),
-            'container': get_scrypted_container_stats()
-        }
-    except:
+        # One shared tree walk feeds cameras/events/storage; the container
+        # probe is independent, so overlap it with the walk
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            container = executor.submit(get_scrypted_container_stats)
+            scan = _scan_recordings()
+            stats = {
+                'cameras': get_scrypted_cameras(scan),
+                'events': get_scrypted_events(scan),
+                'storage': get_scrypted_storage(scan),
+                'container': container.result()
+            }
+        STATS_CACHE['time'] = now
+        STATS_CACHE['data'] = stats
+        return stats
+    except Exception as e:
+        logger.debug('scrypted stats collection failed', exc_info=e)
         return {
             'cameras': {'cameras': [], 'total': 0, 'recording': 0},
             'events': {'today': 0, 'week': 0},
@@ -127,6 +437,53 @@ def get_all_scrypted_stats():
             'container': {'status': 'error', 'uptime': 'N/A', 'started': 'N/A'}
         }
 
+DAEMON_SOCKET = os.getenv('SCRYPTED_STATS_SOCKET', '/run/scrypted-stats.sock')
+
+def run_daemon():
+    """Serve the stats JSON over a UNIX socket from one warm interpreter.
+
+    Keeps the TTL caches, inotify watcher, SQLite index and Docker socket
+    alive across polls instead of paying Python cold-start per invocation.
+    """
+    import socketserver
+
+    class StatsRequestHandler(socketserver.StreamRequestHandler):
+        def handle(self):
+            self.wfile.write(json.dumps(get_all_scrypted_stats()).encode())
+
+    try:
+        os.unlink(DAEMON_SOCKET)
+    except OSError:
+        pass
+    with socketserver.ThreadingUnixStreamServer(DAEMON_SOCKET, StatsRequestHandler) as server:
+        print(f"scrypted stats daemon listening on {DAEMON_SOCKET}")
+        server.serve_forever()
+
+def query_daemon(timeout=5):
+    """Fetch stats from a running daemon; None when it is not available"""
+    try:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as client:
+            client.settimeout(timeout)
+            client.connect(DAEMON_SOCKET)
+            chunks = []
+            while True:
+                buf = client.recv(65536)
+                if not buf:
+                    break
+                chunks.append(buf)
+        return json.loads(b''.join(chunks)) if chunks else None
+    except (OSError, ValueError):
+        return None
+
 if __name__ == '__main__':
-    import json
-    print(json.dumps(get_all_scrypted_stats(), indent=2))
+    import faulthandler
+    import sys
+    faulthandler.enable()
+    if '--daemon' in sys.argv[1:]:
+        run_daemon()
+    else:
+        # Prefer the warm daemon; fall back to collecting in-process
+        stats = query_daemon()
+        if stats is None:
+            stats = get_all_scrypted_stats()
+        print(json.dumps(stats, indent=2))
@@ -5,16 +5,27 @@ Supports various hardware configurations (SD-only, NVMe, Hailo, USB SSD, etc.)
 """
 
 from http.server import HTTPServer, BaseHTTPRequestHandler
+from socketserver import ThreadingMixIn
+import gzip
+import http.client
 import json
 import subprocess
 import psutil
 import os
+import shutil
+import signal
+import threading
 import time
 import ssl
 import base64
+import functools
 import socket
 import re
 import ipaddress
+import hashlib
+from collections import OrderedDict
+from urllib.parse import parse_qs, quote
+from concurrent.futures import ThreadPoolExecutor
 from datetime import timedelta
 
 # PAM authentication
@@ -25,14 +36,120 @@ except ImportError:
     PAM_AVAILABLE = False
     print("WARNING: python-pam not available, authentication disabled")
 
+# Successful PAM auths are remembered briefly - the shadow hash is
+# intentionally slow (tens of ms), far too costly to redo on every poll.
+# Keys are keyed blake2b digests of the auth header so the cache never
+# stores credentials and can't be probed without the per-process secret.
+AUTH_CACHE_TTL = 60
+AUTH_CACHE_MAX = 1024
+_AUTH_CACHE = OrderedDict()
+_AUTH_CACHE_SECRET = os.urandom(32)
+_auth_cache_lock = threading.Lock()
+
 # Cache for stats (refresh every 5 seconds)
 STATS_CACHE = {}
 CACHE_DURATION = 5
 
-# Hardware detection cache
-HARDWARE_CACHE = None
-HARDWARE_CACHE_TIME = 0
-HARDWARE_CACHE_DURATION = 30  # Re-detect every 30 seconds
+
+def ttl_cache(seconds=1.0):
+    """Reuse a zero-argument collector's result for a short window.
+
+    The collectors behind this fork subprocesses or poke the Docker
+    daemon; a burst of concurrent callers inside the TTL shares one
+    computation (the lock is held while computing, so followers wait on
+    the first caller's result instead of duplicating the work).
+    """
+    def decorator(func):
+        state = {'ts': 0.0, 'value': None}
+        lock = threading.Lock()
+
+        @functools.wraps(func)
+        def wrapper():
+            with lock:
+                if state['value'] is None or time.time() - state['ts'] >= seconds:
+                    state['value'] = func()
+                    state['ts'] = time.time()
+                return state['value']
+        return wrapper
+    return decorator
+
+# Byte-to-gigabyte rendering, bound once at import. The collectors emit
+# 20+ of these strings per request; a prebound format method and a
+# multiply replace repeated f-string division at every site.
+_GB = 1.0 / (1 << 30)
+_fmt_gb = '{:.1f} GB'.format
+_fmt_gb2 = '{:.2f} GB'.format
+
+# Keys rendered with two decimals: cumulative traffic counters where
+# 0.1 GB steps are too coarse to watch move.
+_HUMANIZE_2DP = frozenset(('rx', 'tx'))
+
+
+def _humanize(payload):
+    """Render '<key>_bytes' integers as '<key>' GB strings, in place.
+
+    Collectors keep raw byte counts so deltas and rates stay computable
+    downstream; the display strings are produced exactly once here, when
+    the snapshot is serialized.
+    """
+    for key in list(payload):
+        value = payload[key]
+        if isinstance(value, dict):
+            _humanize(value)
+        elif isinstance(value, list):
+            for item in value:
+                if isinstance(item, dict):
+                    _humanize(item)
+        elif key.endswith('_bytes'):
+            short = key[:-6]
+            fmt = _fmt_gb2 if short in _HUMANIZE_2DP else _fmt_gb
+            payload[short] = fmt(value * _GB)
+            del payload[key]
+    return payload
+
+
+# Long-lived descriptors for hot /proc and /sys pseudo-files. Opening
+# and closing one of these per poll costs two syscalls plus a dentry
+# walk; pseudo-files support pread at offset 0, so a cached fd serves
+# every subsequent poll with a single read syscall.
+_PROC_FDS = {}
+_proc_fds_lock = threading.Lock()
+
+
+def _pread_proc(path, size=65536):
+    """Read a /proc or /sys pseudo-file via a cached descriptor"""
+    fd = _PROC_FDS.get(path)
+    if fd is None:
+        with _proc_fds_lock:
+            fd = _PROC_FDS.get(path)
+            if fd is None:
+                fd = os.open(path, os.O_RDONLY)
+                _PROC_FDS[path] = fd
+    try:
+        return os.pread(fd, size, 0)
+    except OSError:
+        # Stale descriptor (procfs remount, device gone): drop it and
+        # retry once through a fresh open.
+        with _proc_fds_lock:
+            if _PROC_FDS.get(path) == fd:
+                del _PROC_FDS[path]
+                try:
+                    os.close(fd)
+                except OSError:
+                    pass
+        fd = os.open(path, os.O_RDONLY)
+        with _proc_fds_lock:
+            _PROC_FDS[path] = fd
+        return os.pread(fd, size, 0)
+
+
+# Hardware detection caches. Fixed hardware (NVMe/SD/Hailo/boot device)
+# never changes after boot, so _detect_static_hardware is memoized with
+# lru_cache and only re-probed on SIGHUP; volatile state
+# (docker/scrypted/usb mount) keeps a short TTL.
+DYNAMIC_HARDWARE = {}
+DYNAMIC_HARDWARE_TIME = 0
+DYNAMIC_HARDWARE_DURATION = 10
 
 # Configurable paths and network overrides
 NETWORK_INTERFACE_PRIORITY = os.getenv('NETWORK_INTERFACE_PRIORITY', 'eth0,end0,wlan0').split(',')
@@ -44,6 +161,358 @@ NVME_BACKUP_PATH = os.getenv('NVME_BACKUP_PATH', os.getenv('BACKUP_DEFAULT_PATH'
 USB_BACKUP_PATH = os.getenv('USB_BACKUP_PATH', '/mnt/backup-ssd/backups')
 BACKUP_DEFAULT_PATH = NVME_BACKUP_PATH
 
+# Backup API endpoint (self-signed cert on the docker bridge)
+BACKUP_API_HOST = '172.17.0.1'
+BACKUP_API_PORT = 8081
+
+# Build the SSL context once - constructing one per request reloads the
+# OpenSSL trust store every time
+BACKUP_SSL_CONTEXT = ssl.create_default_context()
+BACKUP_SSL_CONTEXT.check_hostname = False
+BACKUP_SSL_CONTEXT.verify_mode = ssl.CERT_NONE
+
+
+def _build_server_ssl_context():
+    """Server TLS context, built once at import rather than per start.
+
+    OpenSSL issues TLS 1.3 session tickets by default, so the browser's
+    poll loop resumes sessions instead of paying a full handshake each
+    time; compression is explicitly off (it would only burn CPU on
+    bodies we already gzip ourselves). Returns None when the cert is
+    missing so run_server can fall back to plain HTTP.
+    """
+    try:
+        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
+        context.options |= ssl.OP_NO_COMPRESSION
+        context.load_cert_chain(
+            certfile='/etc/ssl/dashboard/server.crt',
+            keyfile='/etc/ssl/dashboard/server.key'
+        )
+        return context
+    except Exception as e:
+        print(f"WARNING: server SSL context unavailable: {e}")
+        return None
+
+
+SERVER_SSL_CONTEXT = _build_server_ssl_context()
+
+# One persistent TLS connection per handler thread, so polling reuses the
+# handshake instead of paying it on every proxy call
+_backup_conn_local = threading.local()
+
+
+def backup_api_request(method, path, body=None, auth_header='', timeout=5):
+    """Send a request to the backup API over a reused TLS connection.
+
+    Returns the raw response body; raises on connection failure after one
+    reconnect attempt.
+    """
+    headers = {'Authorization': auth_header}
+    if body is not None:
+        headers['Content-Type'] = 'application/json'
+    last_error = None
+    for attempt in range(2):
+        conn = getattr(_backup_conn_local, 'conn', None)
+        try:
+            if conn is None:
+                conn = http.client.HTTPSConnection(
+                    BACKUP_API_HOST, BACKUP_API_PORT,
+                    timeout=timeout, context=BACKUP_SSL_CONTEXT
+                )
+                _backup_conn_local.conn = conn
+            conn.request(method, path, body=body, headers=headers)
+            response = conn.getresponse()
+            return response.read()
+        except (OSError, http.client.HTTPException) as e:
+            # Connection went stale - drop it and retry once fresh
+            last_error = e
+            try:
+                conn.close()
+            except Exception:
+                pass
+            _backup_conn_local.conn = None
+    raise last_error
+
+def backup_api_stream(method, path, body=None, auth_header='', timeout=5):
+    """Like backup_api_request but hands back the live response so the
+    caller can stream it; consume it fully or call backup_conn_reset().
+    """
+    headers = {'Authorization': auth_header}
+    if body is not None:
+        headers['Content-Type'] = 'application/json'
+    last_error = None
+    for attempt in range(2):
+        conn = getattr(_backup_conn_local, 'conn', None)
+        try:
+            if conn is None:
+                conn = http.client.HTTPSConnection(
+                    BACKUP_API_HOST, BACKUP_API_PORT,
+                    timeout=timeout, context=BACKUP_SSL_CONTEXT
+                )
+                _backup_conn_local.conn = conn
+            conn.request(method, path, body=body, headers=headers)
+            return conn.getresponse()
+        except (OSError, http.client.HTTPException) as e:
+            last_error = e
+            try:
+                conn.close()
+            except Exception:
+                pass
+            _backup_conn_local.conn = None
+    raise last_error
+
+
+def backup_conn_reset():
+    """Drop this thread's backup-API connection (e.g. mid-stream abort)"""
+    conn = getattr(_backup_conn_local, 'conn', None)
+    if conn is not None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+        _backup_conn_local.conn = None
+
+
+# Docker Engine API over the daemon's UNIX socket - avoids forking the Go
+# CLI (and its 1s sampling window for stats) on every poll
+DOCKER_SOCKET = '/var/run/docker.sock'
+
+
+class DockerSocketConnection(http.client.HTTPConnection):
+    """HTTP connection to the Docker daemon's UNIX socket"""
+    def __init__(self, timeout=5):
+        super().__init__('localhost', timeout=timeout)
+
+    def connect(self):
+        self.sock = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+        self.sock.settimeout(self.timeout)
+        self.sock.connect(DOCKER_SOCKET)
+
+
+_docker_conn_local = threading.local()
+
+# Circuit breaker: a degraded dockerd makes every caller eat its full
+# timeout. After two consecutive failed calls the circuit opens for 30s
+# and Docker paths fail fast instead of stalling the stats pipeline.
+_DOCKER_CIRCUIT = {'fails': 0, 'cooldown_until': 0.0}
+DOCKER_FAIL_THRESHOLD = 2
+DOCKER_COOLDOWN = 30
+
+
+def _docker_circuit_precheck():
+    if time.time() < _DOCKER_CIRCUIT['cooldown_until']:
+        raise OSError('docker circuit open - daemon marked unhealthy')
+
+
+def _docker_circuit_record(success):
+    if success:
+        _DOCKER_CIRCUIT['fails'] = 0
+    else:
+        _DOCKER_CIRCUIT['fails'] += 1
+        if _DOCKER_CIRCUIT['fails'] >= DOCKER_FAIL_THRESHOLD:
+            _DOCKER_CIRCUIT['cooldown_until'] = time.time() + DOCKER_COOLDOWN
+            _DOCKER_CIRCUIT['fails'] = 0
+
+
+def docker_api_request(method, path, timeout=5):
+    """Call the Docker Engine API over a reused per-thread connection.
+
+    Returns (status, body bytes); raises after one reconnect attempt or
+    immediately while the circuit breaker is open.
+    """
+    _docker_circuit_precheck()
+    last_error = None
+    for attempt in range(2):
+        conn = getattr(_docker_conn_local, 'conn', None)
+        try:
+            if conn is None:
+                conn = DockerSocketConnection(timeout=timeout)
+                _docker_conn_local.conn = conn
+            conn.request(method, path)
+            response = conn.getresponse()
+            result = response.status, response.read()
+            _docker_circuit_record(True)
+            return result
+        except (OSError, http.client.HTTPException) as e:
+            last_error = e
+            try:
+                conn.close()
+            except Exception:
+                pass
+            _docker_conn_local.conn = None
+    _docker_circuit_record(False)
+    raise last_error
+
+
+def docker_api_stream(method, path, timeout=5):
+    """Like docker_api_request but hands back the live response so the
+    caller can read it incrementally.
+
+    The caller must either consume the response fully or call
+    docker_conn_reset() before the per-thread connection is reused.
+    """
+    _docker_circuit_precheck()
+    last_error = None
+    for attempt in range(2):
+        conn = getattr(_docker_conn_local, 'conn', None)
+        try:
+            if conn is None:
+                conn = DockerSocketConnection(timeout=timeout)
+                _docker_conn_local.conn = conn
+            conn.request(method, path)
+            response = conn.getresponse()
+            _docker_circuit_record(True)
+            return response
+        except (OSError, http.client.HTTPException) as e:
+            last_error = e
+            try:
+                conn.close()
+            except Exception:
+                pass
+            _docker_conn_local.conn = None
+    _docker_circuit_record(False)
+    raise last_error
+
+
+def docker_conn_reset():
+    """Drop this thread's Docker connection (e.g. mid-stream abort)"""
+    conn = getattr(_docker_conn_local, 'conn', None)
+    if conn is not None:
+        try:
+            conn.close()
+        except Exception:
+            pass
+        _docker_conn_local.conn = None
+
+
+# Whether a scrypted container is currently running. Kept current by a
+# long-lived /events subscription instead of running 'docker ps' on
+# every hardware refresh - poll replaced by push.
+_SCRYPTED_RUNNING = {'flag': False}
+_docker_events_started = False
+_docker_events_lock = threading.Lock()
+
+
+def _docker_filters(**filters):
+    """Percent-encoded filters query value for the Engine API"""
+    return quote(json.dumps(filters, separators=(',', ':')))
+
+
+def _probe_scrypted_running():
+    """One-shot check used to seed and re-sync the events-driven flag"""
+    try:
+        status, body = docker_api_request(
+            'GET', '/containers/json?filters=' + _docker_filters(name=['scrypted'])
+        )
+        if status == 200:
+            return any('scrypted' in name
+                       for c in json.loads(body)
+                       for name in c.get('Names', []))
+    except Exception:
+        pass
+    return False
+
+
+def _docker_events_loop():
+    """Follow container start/die events and keep the scrypted flag live"""
+    events_path = '/events?filters=' + _docker_filters(
+        type=['container'], event=['start', 'die'])
+    while True:
+        try:
+            # No timeout: the stream idles until something happens
+            response = docker_api_stream('GET', events_path, timeout=None)
+            if response.status == 200:
+                for line in response:
+                    event = json.loads(line)
+                    name = event.get('Actor', {}).get('Attributes', {}).get('name', '')
+                    if 'scrypted' in name:
+                        _SCRYPTED_RUNNING['flag'] = event.get('Action') == 'start'
+            else:
+                response.read()
+        except Exception:
+            pass
+        # Stream dropped (daemon restart etc.) - re-sync, then resubscribe
+        docker_conn_reset()
+        time.sleep(5)
+        _SCRYPTED_RUNNING['flag'] = _probe_scrypted_running()
+
+
+def _ensure_docker_events_thread():
+    global _docker_events_started
+    with _docker_events_lock:
+        if _docker_events_started:
+            return
+        _docker_events_started = True
+    _SCRYPTED_RUNNING['flag'] = _probe_scrypted_running()
+    threading.Thread(target=_docker_events_loop, daemon=True).start()
+
+
+# Previous CPU counters per container id, so one-shot stats samples can be
+# turned into a usage percentage without the CLI's 1s sampling sleep
+_PREV_CPU_SAMPLES = {}
+
+
+def _format_mib(num_bytes):
+    """Render a byte count the way docker stats does (binary units)"""
+    for unit in ('B', 'KiB', 'MiB', 'GiB', 'TiB'):
+        if num_bytes < 1024 or unit == 'TiB':
+            return f"{num_bytes:.1f}{unit}"
+        num_bytes /= 1024
+
+
+def _collect_container_stats(container):
+    """Fetch one-shot Engine API stats for a container listing entry"""
+    cid = container.get('Id', '')
+    names = container.get('Names') or ['/']
+    name = names[0].lstrip('/')
+    try:
+        status, body = docker_api_request(
+            'GET', f'/containers/{cid}/stats?stream=false&one-shot=true', timeout=4
+        )
+        if status != 200:
+            return None
+        stats = json.loads(body)
+
+        cpu_stats = stats.get('cpu_stats', {})
+        cpu_total = cpu_stats.get('cpu_usage', {}).get('total_usage', 0)
+        system_total = cpu_stats.get('system_cpu_usage', 0)
+        online_cpus = (cpu_stats.get('online_cpus')
+                       or len(cpu_stats.get('cpu_usage', {}).get('percpu_usage') or [])
+                       or 1)
+        prev = _PREV_CPU_SAMPLES.get(cid)
+        _PREV_CPU_SAMPLES[cid] = (cpu_total, system_total)
+        cpu_percent = 0.0
+        if prev and system_total > prev[1]:
+            cpu_percent = ((cpu_total - prev[0]) / (system_total - prev[1])
+                           * online_cpus * 100.0)
+
+        mem_stats = stats.get('memory_stats', {})
+        mem_usage = mem_stats.get('usage', 0) - mem_stats.get('stats', {}).get('inactive_file', 0)
+        mem_limit = mem_stats.get('limit', 0)
+        mem_percent = (mem_usage / mem_limit * 100.0) if mem_limit else 0.0
+
+        networks = stats.get('networks') or {}
+        rx = sum(n.get('rx_bytes', 0) for n in networks.values())
+        tx = sum(n.get('tx_bytes', 0) for n in networks.values())
+
+        blkio = stats.get('blkio_stats', {}).get('io_service_bytes_recursive') or []
+        read_bytes = sum(e.get('value', 0) for e in blkio if e.get('op', '').lower() == 'read')
+        write_bytes = sum(e.get('value', 0) for e in blkio if e.get('op', '').lower() == 'write')
+
+        return {
+            'name': name,
+            'id': cid,
+            'cpu': f"{cpu_percent:.2f}%",
+            'memory': f"{_format_mib(mem_usage)} / {_format_mib(mem_limit)}",
+            'mem_percent': f"{mem_percent:.2f}%",
+            'network': f"{_format_mib(rx)} / {_format_mib(tx)}",
+            'disk': f"{_format_mib(read_bytes)} / {_format_mib(write_bytes)}",
+            'status': container.get('State', 'running')
+        }
+    except Exception:
+        return None
+
+
 # Import Scrypted stats module
 try:
     from scrypted_stats import get_all_scrypted_stats
@@ -53,54 +522,136 @@ except ImportError:
     def get_all_scrypted_stats():
         return {'error': 'Module not available'}
 
+# Scrypted aggregation walks the recordings tree and talks to Docker -
+# serve the last-known result immediately and refresh it off-thread
+# (stale-while-revalidate) so its latency never shows up in /api/stats
+_SCRYPTED_CACHE = {'data': {}, 'ts': 0}
+SCRYPTED_CACHE_DURATION = 15
+_scrypted_refresh_lock = threading.Lock()
 
-def detect_hardware():
-    """Detect available hardware components"""
-    global HARDWARE_CACHE, HARDWARE_CACHE_TIME
-    
-    current_time = time.time()
-    if HARDWARE_CACHE and (current_time - HARDWARE_CACHE_TIME) < HARDWARE_CACHE_DURATION:
-        return HARDWARE_CACHE
-    
+
+def _refresh_scrypted():
+    if not _scrypted_refresh_lock.acquire(blocking=False):
+        return  # a refresh is already in flight
+    try:
+        data = get_all_scrypted_stats()
+        _SCRYPTED_CACHE.update(data=data, ts=time.time())
+    except Exception as e:
+        print(f"Scrypted refresh failed: {e}")
+    finally:
+        _scrypted_refresh_lock.release()
+
+
+def get_scrypted_stats_cached():
+    """Last-known scrypted stats, refreshed in the background when stale"""
+    if time.time() - _SCRYPTED_CACHE['ts'] > SCRYPTED_CACHE_DURATION:
+        threading.Thread(target=_refresh_scrypted, daemon=True).start()
+    return _SCRYPTED_CACHE['data']
+
+
+def _device_names():
+    """Device node names under /dev and /host/dev as one set.
+
+    Two directory reads replace the dozen-plus individual stat() calls
+    the per-path os.path.exists probes used to issue.
+    """
+    names = set()
+    for dev_root in ('/dev', '/host/dev'):
+        try:
+            names.update(entry.name for entry in os.scandir(dev_root))
+        except OSError:
+            pass
+    return names
+
+
+HAILO_PCI_VENDOR = '0x1e60'
+NVME_PCI_CLASS = '0x0108'  # mass storage / NVM Express
+
+
+def _scan_pci():
+    """Walk the PCI bus once and report everything hardware detection needs.
+
+    One scandir of /sys/bus/pci/devices replaces the separate per-device
+    existence probes: each device's vendor and class files are read in the
+    same pass, so adding another PCI check later costs nothing extra.
+    """
+    result = {'nvme': False, 'hailo_pci_addr': None}
+    for pci_root in ('/host/sys/bus/pci/devices', '/sys/bus/pci/devices'):
+        try:
+            entries = list(os.scandir(pci_root))
+        except OSError:
+            continue
+        for entry in entries:
+            try:
+                with open(entry.path + '/vendor') as f:
+                    vendor = f.read().strip()
+                with open(entry.path + '/class') as f:
+                    dev_class = f.read().strip()
+            except OSError:
+                continue
+            if vendor == HAILO_PCI_VENDOR:
+                result['hailo_pci_addr'] = entry.name
+            if dev_class.startswith(NVME_PCI_CLASS):
+                result['nvme'] = True
+        break
+    return result
+
+
+def _root_mount_source():
+    """Source device of the root mount, read straight from mountinfo.
+
+    Replaces the findmnt fork: the host's pid-1 view is preferred so the
+    answer is the real boot device rather than the container's overlay.
+    Fields before ' - ' are positional (index 4 is the mount point); the
+    source device is the second field after the separator.
+    """
+    for mountinfo in ('/host/proc/1/mountinfo', '/proc/self/mountinfo'):
+        try:
+            with open(mountinfo) as f:
+                for line in f:
+                    fields = line.split()
+                    if len(fields) > 4 and fields[4] == '/':
+                        _, _, tail = line.partition(' - ')
+                        tail_fields = tail.split()
+                        if len(tail_fields) >= 2:
+                            return tail_fields[1]
+        except OSError:
+            continue
+    return ''
+
+
+@functools.lru_cache(maxsize=1)
+def _detect_static_hardware():
+    """Probe the hardware that cannot change while the system is up.
+
+    Memoized: after the first call this is a dict lookup. SIGHUP clears
+    the cache for the rare case of re-detection without a restart.
+    """
     hardware = {
         'nvme': False,
-        'usb_ssd': False,
         'sd_card': False,
         'hailo': False,
-        'docker': False,
-        'scrypted': False,
         'boot_device': 'unknown'
     }
-    
-    # Detect NVMe
-    try:
-        if any(os.path.exists(f'/dev/nvme{i}') or os.path.exists(f'/host/dev/nvme{i}') 
-               for i in range(5)):
-            hardware['nvme'] = True
-    except:
-        pass
-    
-    # Detect USB SSD (backup drive)
-    try:
-        if os.path.exists('/mnt/backup-ssd') and os.path.ismount('/mnt/backup-ssd'):
-            hardware['usb_ssd'] = True
-    except:
-        pass
-    
+
+    # One PCI bus walk covers both NVMe and Hailo
+    pci = _scan_pci()
+    hardware['nvme'] = pci['nvme']
+    hardware['hailo'] = pci['hailo_pci_addr'] is not None
+
+    devs = _device_names()
+
+    # Fall back to device nodes when sysfs isn't mapped into the container
+    if not hardware['nvme']:
+        hardware['nvme'] = any(f'nvme{i}' in devs for i in range(5))
+    if not hardware['hailo']:
+        hardware['hailo'] = 'hailo0' in devs
+
     # Detect SD card
-    try:
-        # Check multiple possible locations
-        sd_paths = ['/dev/mmcblk0', '/host/dev/mmcblk0', '/dev/mmcblk0p1', '/host/dev/mmcblk0p1']
-        if any(os.path.exists(path) for path in sd_paths):
-            hardware['sd_card'] = True
-    except:
-        pass
-    
+    hardware['sd_card'] = 'mmcblk0' in devs or 'mmcblk0p1' in devs
+
     # Detect boot device using mounted root source
-    try:
-        root_source = subprocess.check_output(['findmnt', '-no', 'SOURCE', '/'], text=True).strip()
-    except Exception:
-        root_source = ''
+    root_source = _root_mount_source()
 
     if root_source:
         if root_source.startswith('/dev/nvme') or root_source.startswith('/host/dev/nvme'):
@@ -110,54 +661,82 @@ def detect_hardware():
         else:
             hardware['boot_device'] = 'unknown'
     else:
-        # Fallback to cmdline heuristic
+        # Fallback to cmdline heuristic - read once, check all markers
         try:
             with open('/proc/cmdline', 'r') as f:
                 cmdline = f.read()
-                if 'root=/dev/nvme' in cmdline or 'root=PARTUUID=' in cmdline:
-                    hardware['boot_device'] = 'nvme' if hardware['nvme'] else 'unknown'
-                elif 'root=/dev/mmcblk0' in cmdline:
-                    hardware['boot_device'] = 'sd'
-                else:
-                    hardware['boot_device'] = 'nvme' if hardware['nvme'] else 'sd'
+            if 'root=/dev/nvme' in cmdline or 'root=PARTUUID=' in cmdline:
+                hardware['boot_device'] = 'nvme' if hardware['nvme'] else 'unknown'
+            elif 'root=/dev/mmcblk0' in cmdline:
+                hardware['boot_device'] = 'sd'
+            else:
+                hardware['boot_device'] = 'nvme' if hardware['nvme'] else 'sd'
         except:
             hardware['boot_device'] = 'nvme' if hardware['nvme'] else 'sd'
-    
-    # Detect Hailo
-    try:
-        if os.path.exists('/dev/hailo0') or os.path.exists('/host/dev/hailo0'):
-            hardware['hailo'] = True
-    except:
-        pass
-    
-    # Detect Docker
+
+    return hardware
+
+
+def _detect_dynamic_hardware():
+    """Probe the state that can change at runtime (docker, scrypted, mounts)"""
+    hardware = {
+        'usb_ssd': False,
+        'docker': False,
+        'scrypted': False
+    }
+
+    # Detect USB SSD (backup drive) - can be (un)mounted via the dashboard
     try:
-        result = subprocess.run(['docker', '--version'], 
-                              capture_output=True, timeout=2)
-        if result.returncode == 0:
-            hardware['docker'] = True
+        if os.path.exists('/mnt/backup-ssd') and os.path.ismount('/mnt/backup-ssd'):
+            hardware['usb_ssd'] = True
     except:
         pass
-    
-    # Detect Scrypted (if Docker available)
+
+    # Detect Docker - the socket being present is what actually matters,
+    # no need to fork the CLI for its version string
+    hardware['docker'] = os.path.exists(DOCKER_SOCKET)
+
+    # Detect Scrypted via the events-maintained flag (seeded with one
+    # probe the first time through)
     if hardware['docker']:
-        try:
-            result = subprocess.run(
-                ['docker', 'ps', '--filter', 'name=scrypted', '--format', '{{.Names}}'],
-                capture_output=True, text=True, timeout=2
-            )
-            if 'scrypted' in result.stdout:
-                hardware['scrypted'] = True
-        except:
-            pass
-    
-    HARDWARE_CACHE = hardware
-    HARDWARE_CACHE_TIME = current_time
+        _ensure_docker_events_thread()
+        hardware['scrypted'] = _SCRYPTED_RUNNING['flag']
+
+    return hardware
+
+
+def detect_hardware():
+    """Detect available hardware components"""
+    global DYNAMIC_HARDWARE, DYNAMIC_HARDWARE_TIME
+
+    current_time = time.time()
+    if not DYNAMIC_HARDWARE or (current_time - DYNAMIC_HARDWARE_TIME) >= DYNAMIC_HARDWARE_DURATION:
+        DYNAMIC_HARDWARE = _detect_dynamic_hardware()
+        DYNAMIC_HARDWARE_TIME = current_time
+
+    hardware = dict(_detect_static_hardware())
+    hardware.update(DYNAMIC_HARDWARE)
     return hardware
 
 
+# The primary IP changes rarely; cache it so the hot path skips the UDP
+# socket trick and the (expensive) psutil interface enumeration fallback
+_IP_CACHE = {'ip': None, 'ts': 0}
+IP_CACHE_TTL = 30
+
+
 def auto_detect_ip():
-    """Detect the primary IP address (non-loopback)"""
+    """Detect the primary IP address (non-loopback), cached briefly"""
+    now = time.time()
+    if _IP_CACHE['ip'] and now - _IP_CACHE['ts'] < IP_CACHE_TTL:
+        return _IP_CACHE['ip']
+    ip = _auto_detect_ip()
+    if ip:
+        _IP_CACHE.update(ip=ip, ts=now)
+    return ip
+
+
+def _auto_detect_ip():
     # Try socket trick to discover the source IP used for outbound traffic
     try:
         with socket.socket(socket.AF_INET, socket.SOCK_DGRAM) as s:
@@ -165,18 +744,23 @@ def auto_detect_ip():
             return s.getsockname()[0]
     except Exception:
         pass
-    # Fall back to interface scan with priority order
+    # Fall back to interface scan with priority order, considering only
+    # interfaces that are actually up - a Pi5 running Docker accumulates
+    # plenty of down veth/tun leftovers not worth walking
     try:
         addrs = psutil.net_if_addrs()
+        up = {name for name, st in psutil.net_if_stats().items() if st.isup}
         for iface in NETWORK_INTERFACE_PRIORITY:
             iface = iface.strip()
-            if not iface or iface not in addrs:
+            if not iface or iface not in addrs or iface not in up:
                 continue
             for snic in addrs.get(iface, []):
                 if snic.family == socket.AF_INET and not snic.address.startswith('127.'):
                     return snic.address
         # Any other non-loopback
-        for if_addrs in addrs.values():
+        for iface, if_addrs in addrs.items():
+            if iface not in up:
+                continue
             for snic in if_addrs:
                 if snic.family == socket.AF_INET and not snic.address.startswith('127.'):
                     return snic.address
@@ -188,6 +772,9 @@ def auto_detect_ip():
 CONTAINER_NAME_CACHE = None
 CONTAINER_ID_CACHE = None
 
+# Docker IDs are long hex strings; compiled once, matched per cgroup line
+_CONTAINER_ID_RE = re.compile(r'[0-9a-f]{12,64}')
+
 
 def _detect_container_identity():
     """Discover container name and id using Docker; cache result."""
@@ -211,8 +798,7 @@ def _detect_container_identity():
                 parts = line.strip().split('/')
                 if len(parts) >= 3 and parts[-1]:
                     candidate = parts[-1]
-                    # Docker IDs are long hex strings
-                    if re.fullmatch(r'[0-9a-f]{12,64}', candidate):
+                    if _CONTAINER_ID_RE.fullmatch(candidate):
                         container_id = candidate
                         break
     except Exception:
@@ -221,12 +807,11 @@ def _detect_container_identity():
     container_name = None
     if container_id:
         try:
-            result = subprocess.run(
-                ['docker', 'inspect', '--format', '{{.Name}}', container_id],
-                capture_output=True, text=True, timeout=2
-            )
-            if result.returncode == 0 and result.stdout:
-                container_name = result.stdout.strip().lstrip('/') or None
+            # One Engine API inspect over the socket instead of forking
+            # the docker CLI; the result is cached for process lifetime
+            status, body = docker_api_request('GET', f'/containers/{container_id}/json', timeout=2)
+            if status == 200:
+                container_name = json.loads(body).get('Name', '').lstrip('/') or None
         except Exception:
             pass
 
@@ -241,185 +826,701 @@ def _detect_container_identity():
     return CONTAINER_NAME_CACHE, CONTAINER_ID_CACHE
 
 
-def host_ip_from_proc():
-    """Parse host IPs from mounted /host/proc/net/fib_trie and pick a likely LAN IP"""
-    candidate = None
-    try:
-        with open('/host/proc/net/fib_trie', 'r') as f:
-            data = f.read()
-        # Find all IPv4 addresses
-        ips = re.findall(r'\b(?:\d{1,3}\.){3}\d{1,3}\b', data)
-        filtered = []
-        for ip in ips:
-            if ip.startswith('127.'):
-                continue
-            # Skip common docker bridge ranges
-            if ip.startswith('172.17.') or ip.startswith('172.18.') or ip.startswith('172.19.'):
-                continue
-            filtered.append(ip)
-        if filtered:
-            candidate = filtered[0]
-    except Exception:
-        candidate = None
-    return candidate, None, None, None
-
-
-def host_ip_from_nsenter():
-    """Use nsenter to query host net namespace for global IPv4 addresses and detect DHCP"""
-    try:
-        cmd = ['nsenter', '--net=/host/proc/1/ns/net', 'ip', '-4', 'addr', 'show', 'scope', 'global']
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=2)
-        if result.returncode != 0:
-            return None, None, None, None
-        lines = result.stdout.split('\n')
-        ips = []
-        for line in lines:
-            line = line.strip()
-            if line.startswith('inet '):
-                parts = line.split()
-                if len(parts) >= 2:
-                    cidr = parts[1]
-                    ip_only = cidr.split('/')[0]
-                    if ip_only.startswith('127.'):
-                        continue
-                    if ip_only.startswith('172.17.') or ip_only.startswith('172.18.') or ip_only.startswith('172.19.'):
-                        continue
-                    if ip_only.startswith('169.254.'):
-                        continue
-                    source = 'dhcp' if 'dynamic' in parts else 'static'
-                    try:
-                        net = ipaddress.IPv4Interface(cidr)
-                        subnet = str(net.netmask)
-                    except Exception:
-                        subnet = None
-                    ips.append((ip_only, source, None, subnet))
-        if ips:
-            return ips[0]
-    except Exception:
-        return None, None, None, None
-    return None, None, None, None
-
+@ttl_cache(seconds=30.0)
+def _query_host_net():
+    """Host primary IP, assignment source, gateway, subnet and interface.
 
-def host_ip_via_route():
-    """Prefer default route interface to pick IP/gateway/subnet (host namespace)"""
+    One pair of 'nsenter ... ip -j' calls replaces the four discovery
+    helpers that each forked their own nsenter/ip pipelines (up to four
+    2s timeouts back to back on a bad path). The default route picks the
+    primary interface; its address wins over any other global address.
+    Routing changes on the order of minutes, so the answer is held for
+    30 seconds rather than re-forked per request.
+    """
+    ns = ['nsenter', '--net=/host/proc/1/ns/net']
     try:
-        route_cmd = ['nsenter', '--net=/host/proc/1/ns/net', 'ip', 'route', 'show', 'default']
-        route_res = subprocess.run(route_cmd, capture_output=True, text=True, timeout=2)
-        if route_res.returncode != 0:
-            return None, None, None, None, None
-        line = route_res.stdout.strip().split('\n')[0] if route_res.stdout else ''
-        if not line:
-            return None, None, None, None, None
-        parts = line.split()
-        gw = None
-        if 'via' in parts:
-            via_idx = parts.index('via') + 1
-            if via_idx < len(parts):
-                gw = parts[via_idx]
-        if 'dev' not in parts:
-            return None, None, None, None, None
-        dev_idx = parts.index('dev') + 1
-        if dev_idx >= len(parts):
-            return None, None, None, None, None
-        iface = parts[dev_idx]
-        addr_cmd = ['nsenter', '--net=/host/proc/1/ns/net', 'ip', '-4', 'addr', 'show', 'dev', iface, 'scope', 'global']
-        addr_res = subprocess.run(addr_cmd, capture_output=True, text=True, timeout=2)
+        addr_res = subprocess.run(
+            ns + ['ip', '-j', '-4', 'addr', 'show', 'scope', 'global'],
+            capture_output=True, text=True, timeout=2
+        )
         if addr_res.returncode != 0:
             return None, None, None, None, None
-        lines = addr_res.stdout.split('\n')
-        for l in lines:
-            l = l.strip()
-            if l.startswith('inet '):
-                parts = l.split()
-                cidr = parts[1]
-                ip_only = cidr.split('/')[0]
-                if ip_only.startswith(('127.', '169.254.', '172.17.', '172.18.', '172.19.')):
-                    continue
-                source = 'dhcp' if 'dynamic' in parts else 'static'
-                try:
-                    net = ipaddress.IPv4Interface(cidr)
-                    subnet = str(net.netmask)
-                except Exception:
-                    subnet = None
-                return ip_only, source, gw, subnet, iface
+        links = json.loads(addr_res.stdout or '[]')
     except Exception:
         return None, None, None, None, None
-    return None, None, None, None, None
-
 
-def host_ip_from_proc_route():
-    """Fallback: parse /host/proc/net/route for default gateway and derive subnet via nsenter ip addr"""
+    gw = None
+    default_dev = None
     try:
-        with open('/host/proc/net/route', 'r') as f:
-            lines = f.readlines()
-        for line in lines[1:]:
-            parts = line.strip().split('\t')
-            if len(parts) < 3:
+        route_res = subprocess.run(
+            ns + ['ip', '-j', 'route', 'show', 'default'],
+            capture_output=True, text=True, timeout=2
+        )
+        if route_res.returncode == 0:
+            routes = json.loads(route_res.stdout or '[]')
+            if routes:
+                gw = routes[0].get('gateway')
+                default_dev = routes[0].get('dev')
+    except Exception:
+        pass
+
+    candidates = []
+    for link in links:
+        ifname = link.get('ifname', '')
+        for addr in link.get('addr_info', []):
+            ip_only = addr.get('local', '')
+            if not ip_only:
                 continue
-            iface, dest_hex, gateway_hex = parts[0], parts[1], parts[2]
-            if dest_hex != '00000000':
-                continue  # not default
-            try:
-                gw = socket.inet_ntoa(bytes.fromhex(gateway_hex))[::-1]
-            except Exception:
-                # Alternative byte order
-                gw = socket.inet_ntoa(bytes.fromhex(gateway_hex)) if len(gateway_hex) == 8 else None
-            # get ip/mask for iface
+            # Skip loopback, link-local and the docker bridge ranges
+            if ip_only.startswith(('127.', '169.254.', '172.17.', '172.18.', '172.19.')):
+                continue
+            source = 'dhcp' if addr.get('dynamic') else 'static'
             try:
-                addr_cmd = ['nsenter', '--net=/host/proc/1/ns/net', 'ip', '-4', 'addr', 'show', 'dev', iface, 'scope', 'global']
-                addr_res = subprocess.run(addr_cmd, capture_output=True, text=True, timeout=2)
-                if addr_res.returncode == 0:
-                    for l in addr_res.stdout.split('\n'):
-                        l = l.strip()
-                        if l.startswith('inet '):
-                            cidr = l.split()[1]
-                            ip_only = cidr.split('/')[0]
-                            if ip_only.startswith(('127.', '169.254.', '172.17.', '172.18.', '172.19.')):
-                                continue
-                            source = 'unknown'
-                            try:
-                                net = ipaddress.IPv4Interface(cidr)
-                                subnet = str(net.netmask)
-                            except Exception:
-                                subnet = None
-                            return ip_only, source, gw, subnet, iface
+                subnet = str(ipaddress.IPv4Interface(
+                    f"{ip_only}/{addr.get('prefixlen', 32)}").netmask)
             except Exception:
-                pass
-    except Exception:
-        return None, None, None, None, None
-    return None, None, None, None, None
+                subnet = None
+            candidates.append((ifname, ip_only, source, subnet))
 
+    for ifname, ip_only, source, subnet in candidates:
+        if default_dev and ifname == default_dev:
+            return ip_only, source, gw, subnet, ifname
+    if candidates:
+        ifname, ip_only, source, subnet = candidates[0]
+        return ip_only, source, gw, subnet, ifname
+    return None, None, gw, None, default_dev
 
-class StatsHandler(BaseHTTPRequestHandler):
-    def check_auth(self):
-        """Check HTTP Basic Authentication using PAM"""
-        if not PAM_AVAILABLE:
-            print("PAM not available - allowing access")
-            return True
-        
-        auth_header = self.headers.get('Authorization')
+
+# Shared pool for the independent stats sections - they're IO-bound on
+# /proc, sysfs and subprocesses, so refresh latency becomes the max of
+# the sections rather than their sum
+_STATS_POOL = ThreadPoolExecutor(max_workers=4)
+
+
+def collect_system_stats():
+    """Gather all system statistics (uncached)"""
+    hardware = detect_hardware()
+
+    futures = {
+        'cpu': _STATS_POOL.submit(get_cpu_stats),
+        'memory': _STATS_POOL.submit(get_memory_stats),
+        'disk': _STATS_POOL.submit(get_disk_stats, hardware),
+        'storage_devices': _STATS_POOL.submit(get_storage_devices),
+        'network': _STATS_POOL.submit(get_network_stats),
+        'system': _STATS_POOL.submit(get_system_info),
+    }
+    if hardware['docker']:
+        futures['docker'] = _STATS_POOL.submit(get_docker_stats)
+    if hardware['hailo']:
+        futures['hailo'] = _STATS_POOL.submit(get_hailo_stats)
+
+    stats = {
+        'hardware': hardware,
+        'backup_config': {
+            'default_path': BACKUP_DEFAULT_PATH,
+            'nvme_path': NVME_BACKUP_PATH,
+            'usb_path': USB_BACKUP_PATH
+        }
+    }
+    for key, future in futures.items():
+        try:
+            stats[key] = future.result(timeout=10)
+        except Exception as e:
+            print(f"Stats section '{key}' failed: {e}")
+            stats[key] = {}
+
+    # Already served from its own stale-while-revalidate cache
+    if hardware['scrypted'] and SCRYPTED_AVAILABLE:
+        stats['scrypted'] = get_scrypted_stats_cached()
+
+    return stats
+
+
+_stats_refresh_lock = threading.Lock()
+
+
+def _refresh_stats_cache():
+    """Collect once and publish dict + pre-serialized JSON atomically.
+
+    Readers see either the old or the new cache dict (a single name
+    rebind); the lock only stops concurrent handler threads from doing
+    the collection work twice.
+    """
+    global STATS_CACHE
+    with _stats_refresh_lock:
+        if 'timestamp' in STATS_CACHE and (time.time() - STATS_CACHE['timestamp']) < CACHE_DURATION:
+            return STATS_CACHE['data']
+        stats = _humanize(collect_system_stats())
+        payload = json.dumps(stats).encode()
+        STATS_CACHE = {
+            'timestamp': time.time(),
+            'data': stats,
+            'json': payload,
+            # Level 1 is plenty for repetitive JSON (~5x smaller) and costs
+            # well under a millisecond at this payload size
+            'gzip': gzip.compress(payload, compresslevel=1)
+        }
+    return stats
+
+
+def _ensure_fresh_stats():
+    """Stale-while-revalidate: only the very first call blocks.
+
+    Once populated, stale data is served immediately and a daemon thread
+    revalidates in the background, so collection latency (docker, disk,
+    network probes) never shows up in request tail latency.
+    """
+    if 'timestamp' not in STATS_CACHE:
+        _refresh_stats_cache()
+        return
+    if ((time.time() - STATS_CACHE['timestamp']) >= CACHE_DURATION
+            and not _stats_refresh_lock.locked()):
+        threading.Thread(target=_refresh_stats_cache, daemon=True).start()
+
+
+def get_system_stats():
+    """Gather all system statistics with caching"""
+    _ensure_fresh_stats()
+    return STATS_CACHE['data']
+
+
+def get_system_stats_json(gzipped=False):
+    """Cached /api/stats payload as bytes, revalidated off-thread"""
+    _ensure_fresh_stats()
+    return STATS_CACHE['gzip'] if gzipped else STATS_CACHE['json']
+
+
+def stats_refresh_loop():
+    """Warm the stats cache so requests never block on collection"""
+    while True:
+        try:
+            _refresh_stats_cache()
+        except Exception as e:
+            print(f"Stats refresh failed: {e}")
+        time.sleep(CACHE_DURATION)
+
+# Previous (busy, total) jiffies per /proc/stat row, so usage can be
+# derived from one parse instead of two psutil walks
+_LAST_CPU_TIMES = {}
+
+
+def _read_proc_stat():
+    """(busy, total) jiffies for the aggregate 'cpu' row and each core"""
+    samples = {}
+    for line in _pread_proc('/proc/stat').decode().splitlines():
+        if not line.startswith('cpu'):
+            break
+        fields = line.split()
+        values = [int(v) for v in fields[1:]]
+        idle = values[3] + (values[4] if len(values) > 4 else 0)
+        total = sum(values)
+        samples[fields[0]] = (total - idle, total)
+    return samples
+
+
+def get_cpu_stats():
+    """Get CPU stats"""
+    global _LAST_CPU_TIMES
+    try:
+        temp = float(_pread_proc('/host/sys/class/thermal/thermal_zone0/temp', 64)) / 1000.0
+    except (OSError, ValueError):
+        temp = 0.0
+
+    # One /proc/stat parse yields total and per-core usage; the snapshot
+    # is seeded at startup so the first delta is already meaningful
+    samples = _read_proc_stat()
+    prev, _LAST_CPU_TIMES = _LAST_CPU_TIMES, samples
+
+    def usage(row):
+        busy, total = samples.get(row, (0, 0))
+        prev_busy, prev_total = prev.get(row, (0, 0))
+        delta = total - prev_total
+        if delta <= 0:
+            return 0.0
+        return round(100.0 * (busy - prev_busy) / delta, 1)
+
+    cpu_percent = usage('cpu')
+    per_core = [usage(row) for row in samples if row != 'cpu']
+
+    load_avg = os.getloadavg()
+    
+    return {
+        'temperature': f"{temp:.1f}",
+        'usage': cpu_percent,
+        'per_core': per_core,
+        'load_avg': f"{load_avg[0]:.2f} {load_avg[1]:.2f} {load_avg[2]:.2f}"
+    }
+
+def get_memory_stats():
+    """Get memory stats"""
+    # One read of /proc/meminfo replaces psutil.virtual_memory(), which
+    # re-opens and fully parses the same file (plus sysinfo fallbacks)
+    # on every call. used/percent are derived from MemAvailable, which
+    # is what the dashboard actually wants to show.
+    try:
+        fields = {}
+        for line in _pread_proc('/proc/meminfo').decode().splitlines():
+            key, _, rest = line.partition(':')
+            fields[key] = int(rest.split()[0]) * 1024
+        total = fields['MemTotal']
+        available = fields.get('MemAvailable', fields.get('MemFree', 0))
+        used = total - available
+        percent = round(used / total * 100, 1) if total else 0.0
+    except (OSError, KeyError, ValueError, IndexError):
+        mem = psutil.virtual_memory()
+        total, used, available, percent = mem.total, mem.used, mem.available, mem.percent
+    return {
+        'total_bytes': total,
+        'used_bytes': used,
+        'available_bytes': available,
+        'percent': percent
+    }
+
+def get_disk_stats(hardware):
+    """Get disk stats based on available hardware"""
+    result = {}
+    
+    # Boot device stats
+    boot_device = hardware['boot_device']
+    root_usage = psutil.disk_usage('/')
+    
+    if boot_device == 'nvme' and hardware['nvme']:
+        result['nvme'] = {
+            'total_bytes': root_usage.total,
+            'used_bytes': root_usage.used,
+            'available_bytes': root_usage.free,
+            'percent': root_usage.percent,
+            'boot': True
+        }
+    elif boot_device == 'sd' and hardware['sd_card']:
+        result['sd_card'] = {
+            'total_bytes': root_usage.total,
+            'used_bytes': root_usage.used,
+            'available_bytes': root_usage.free,
+            'percent': root_usage.percent,
+            'boot': True
+        }
+    
+    # USB SSD backup drive
+    if hardware['usb_ssd']:
+        try:
+            usb_usage = psutil.disk_usage('/mnt/backup-ssd')
+            result['usb_ssd'] = {
+                'total_bytes': usb_usage.total,
+                'used_bytes': usb_usage.used,
+                'available_bytes': usb_usage.free,
+                'percent': usb_usage.percent,
+                'mounted': True
+            }
+        except:
+            result['usb_ssd'] = {'mounted': False}
+    
+    # SD card (if not boot device but present)
+    if hardware['sd_card'] and boot_device != 'sd':
+        # Read size and partition layout straight from sysfs instead of
+        # forking lsblk and scraping its tree-drawn output
+        try:
+            sys_base = None
+            for path in ['/host/sys/block/mmcblk0', '/sys/block/mmcblk0']:
+                if os.path.exists(path):
+                    sys_base = path
+                    break
+
+            if not sys_base:
+                result['sd_card'] = {'present': True, 'accessible': False}
+            else:
+                # sysfs size files are in 512-byte sectors
+                with open(f'{sys_base}/size', 'r') as f:
+                    total_size = int(f.read().strip()) * 512
+
+                # Map partition devices to mountpoints in one /proc/mounts pass
+                mounts = {}
+                with open('/proc/mounts', 'r') as f:
+                    for line in f:
+                        parts = line.split()
+                        if len(parts) >= 2:
+                            mounts[parts[0]] = parts[1]
+
+                used_size = 0
+                mounted_any = False
+                seen_devs = set()
+                for entry in os.listdir(sys_base):
+                    if not entry.startswith('mmcblk0p'):
+                        continue
+                    for dev in (f'/dev/{entry}', f'/host/dev/{entry}'):
+                        mountpoint = mounts.get(dev)
+                        if not mountpoint:
+                            continue
+                        try:
+                            # statvfs directly gives the same numbers
+                            # psutil.disk_usage wraps; deduping on st_dev
+                            # keeps bind mounts of one filesystem from
+                            # being counted twice
+                            st_dev = os.stat(mountpoint).st_dev
+                            if st_dev not in seen_devs:
+                                seen_devs.add(st_dev)
+                                vfs = os.statvfs(mountpoint)
+                                used_size += (vfs.f_blocks - vfs.f_bfree) * vfs.f_frsize
+                            mounted_any = True
+                        except OSError:
+                            pass
+                        break
+
+                if total_size > 0 and mounted_any:
+                    available_size = total_size - used_size
+                    percent = (used_size / total_size) * 100
+
+                    result['sd_card'] = {
+                        'total_bytes': total_size,
+                        'used_bytes': used_size,
+                        'available_bytes': available_size,
+                        'percent': round(percent, 1),
+                        'boot': False
+                    }
+                else:
+                    result['sd_card'] = {'present': True, 'mounted': False}
+        except Exception as e:
+            result['sd_card'] = {'present': True, 'error': str(e)}
+
+    return result
+
+def _host_net_io_counters():
+    """Per-NIC I/O counters, read from the host's /proc when it is mounted"""
+    if os.path.isdir('/host/proc'):
+        original = psutil.PROCFS_PATH
+        psutil.PROCFS_PATH = '/host/proc'
+        try:
+            return psutil.net_io_counters(pernic=True)
+        finally:
+            psutil.PROCFS_PATH = original
+    return psutil.net_io_counters(pernic=True)
+
+
+def get_network_stats():
+    """Get network stats"""
+    detected_container_ip = auto_detect_ip()
+
+    net_ip, net_source, gw, subnet, _net_iface = _query_host_net()
+
+    host_ip = IP_OVERRIDE or net_ip or detected_container_ip or 'Unknown'
+
+    # Determine assignment source
+    if IP_OVERRIDE:
+        assignment = 'static (override)'
+    elif net_source:
+        assignment = net_source
+    else:
+        assignment = 'unknown'
+
+
+    rx_bytes = 0
+    tx_bytes = 0
+    try:
+        # One /proc/net/dev parse replaces two sysfs opens per interface
+        # (six syscall round-trips, most failing for absent interfaces)
+        nios = _host_net_io_counters()
+        for iface in ('eth0', 'wlan0', 'end0'):
+            nio = nios.get(iface)
+            if nio:
+                rx_bytes += nio.bytes_recv
+                tx_bytes += nio.bytes_sent
+    except:
+        net_io = psutil.net_io_counters()
+        rx_bytes = net_io.bytes_recv
+        tx_bytes = net_io.bytes_sent
+    
+    config_block = {}
+    if STATIC_IP:
+        config_block['ip'] = STATIC_IP
+    if STATIC_GATEWAY:
+        config_block['gateway'] = STATIC_GATEWAY
+    if STATIC_SUBNET:
+        config_block['subnet'] = STATIC_SUBNET
+
+    suggested_env = None
+    if host_ip and host_ip != 'Unknown' and not IP_OVERRIDE:
+        suggested_env = f"DASHBOARD_IP_OVERRIDE={host_ip}"
+
+    container_name, container_id = _detect_container_identity()
+
+    return {
+        'ip': host_ip,
+        'container_ip': detected_container_ip or 'Unknown',
+        'container_name': container_name,
+        'container_id': container_id,
+        'rx_bytes': rx_bytes,
+        'tx_bytes': tx_bytes,
+        'config': config_block,
+        'assignment': assignment,
+        'dhcp': assignment == 'dhcp',
+        'gateway': gw,
+        'subnet': subnet,
+        'suggested_env': suggested_env,
+        'ports': {
+            'dashboard_https': 8443,
+            'backup_api_internal': 8081
+        }
+    }
+
+@ttl_cache(seconds=1.0)
+def get_docker_stats():
+    """Get Docker stats"""
+    try:
+        status, body = docker_api_request('GET', '/containers/json')
+        if status != 200:
+            return {'containers': []}
+        listing = json.loads(body)
+        if not listing:
+            return {'containers': []}
+
+        # One-shot stats per container, collected in parallel - the CLI's
+        # 'docker stats --no-stream' forks a Go binary and sleeps a full
+        # sampling window before answering
+        with ThreadPoolExecutor(max_workers=min(8, len(listing))) as executor:
+            results = executor.map(_collect_container_stats, listing)
+        containers = [c for c in results if c]
+
+        return {'containers': containers}
+
+    except Exception as e:
+        return {'containers': [], 'error': str(e)}
+
+@ttl_cache(seconds=60.0)
+def _hailo_driver_version():
+    """Version of the loaded hailo_pci module, or None if it isn't loaded.
+
+    Loaded modules change only on insmod/rmmod, so the scan of the host's
+    module list is memoized for a minute rather than re-read per request.
+    """
+    try:
+        with open('/host/proc/modules', 'r') as f:
+            for line in f:
+                if 'hailo_pci' in line:
+                    parts = line.split()
+                    return parts[1] if len(parts) > 1 else 'Loaded'
+    except OSError:
+        pass
+    return None
+
+
+@ttl_cache(seconds=60.0)
+def _hailo_pci_address():
+    """PCI address of the Hailo accelerator, memoized for a minute.
+
+    When the driver is bound, its sysfs directory already links to the
+    device, so one scandir yields the address with zero file reads (the
+    bound-device entries are the only names containing ':'). The full
+    vendor-file bus walk in _scan_pci is only the fallback. PCI topology
+    doesn't change at runtime, so a minute of caching loses nothing.
+    """
+    for drv_root in ('/host/sys/bus/pci/drivers/hailo_pci', '/sys/bus/pci/drivers/hailo_pci'):
+        try:
+            for entry in os.scandir(drv_root):
+                if ':' in entry.name:
+                    return entry.name
+        except OSError:
+            continue
+    return _scan_pci()['hailo_pci_addr']
+
+
+@ttl_cache(seconds=1.0)
+def get_hailo_stats():
+    """Get Hailo stats"""
+    stats = {
+        'device': 'Not found',
+        'driver': 'Not loaded',
+        'driver_version': 'N/A',
+        'pci_address': 'N/A',
+        'status': '❌ Inactive'
+    }
+
+    try:
+        # No device node means no accelerator: skip the module-list and
+        # PCI lookups entirely so absent hardware costs one scandir
+        if 'hailo0' not in _device_names():
+            return stats
+        stats['device'] = '/dev/hailo0'
+
+        driver_version = _hailo_driver_version()
+        if driver_version is not None:
+            stats['driver'] = 'hailo_pci'
+            stats['driver_version'] = driver_version
+
+        pci_address = _hailo_pci_address()
+        if pci_address:
+            stats['pci_address'] = pci_address
+
+        if stats['device'] != 'Not found' and stats['driver'] != 'Not loaded':
+            stats['status'] = '✅ Active'
+
+        return stats
+
+    except Exception as e:
+        stats['status'] = f'Error: {str(e)}'
+        return stats
+
+@ttl_cache(seconds=1.0)
+def get_storage_devices():
+    """Enumerate storage devices and their mount status"""
+    devices = []
+    try:
+        lsblk = subprocess.run(
+            ['lsblk', '-J', '-b', '-o', 'NAME,PATH,SIZE,TYPE,TRAN,MOUNTPOINT,MODEL,FSTYPE'],
+            capture_output=True, text=True, timeout=5
+        )
+        if lsblk.returncode != 0:
+            return {'error': lsblk.stderr.strip()}
+        data = json.loads(lsblk.stdout)
+        for blk in data.get('blockdevices', []):
+            if blk.get('type') != 'disk':
+                continue
+            mountpoint = blk.get('mountpoint') or ''
+            mounted = bool(mountpoint)
+            # Suggested mountpoint for known roles
+            suggested_mount = None
+            if blk.get('tran') == 'usb':
+                suggested_mount = '/mnt/backup-ssd'
+            usage = None
+            if mounted:
+                try:
+                    u = psutil.disk_usage(mountpoint)
+                    usage = {
+                        'total': _fmt_gb(u.total * _GB),
+                        'used': _fmt_gb(u.used * _GB),
+                        'available': _fmt_gb(u.free * _GB),
+                        'percent': u.percent
+                    }
+                except Exception:
+                    usage = None
+            devices.append({
+                'name': blk.get('name'),
+                'path': blk.get('path'),
+                'model': blk.get('model', '').strip(),
+                'size': _fmt_gb(int(blk.get('size', 0)) * _GB) if blk.get('size') else '0 GB',
+                'transport': blk.get('tran', ''),
+                'fstype': blk.get('fstype', ''),
+                'mounted': mounted,
+                'mountpoint': mountpoint,
+                'suggested_mount': suggested_mount,
+                'usage': usage
+            })
+    except Exception as e:
+        return {'error': str(e)}
+    return devices
+
+# Boot time never changes while we're running - read it once
+_BOOT_TIME = int(psutil.boot_time())
+
+
+def get_system_info():
+    """Get system info"""
+    return {'uptime': str(timedelta(seconds=int(time.time()) - _BOOT_TIME))}
+
+
+# Static payloads, encoded once instead of per request
+FAVICON_BYTES = '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
+    <defs>
+        <linearGradient id="g" x1="0%" y1="0%" x2="100%" y2="100%">
+            <stop offset="0%" style="stop-color:#2196F3"/>
+            <stop offset="100%" style="stop-color:#1976D2"/>
+        </linearGradient>
+    </defs>
+    <circle cx="50" cy="50" r="48" fill="url(#g)"/>
+    <text x="50" y="73" font-family="Georgia,serif" font-size="70" font-weight="bold" fill="white" text-anchor="middle">π</text>
+</svg>'''.encode()
+
+INDEX_HTML_PATH = '/app/index.html'
+_INDEX_CACHE = {'mtime': 0, 'data': b'', 'etag': ''}
+
+
+def get_index_html():
+    """index.html bytes + ETag, re-read only when the file changes.
+
+    A single stat() per request keeps the cache honest when the file is
+    updated in place (e.g. a redeployed bind mount).
+    """
+    mtime = os.stat(INDEX_HTML_PATH).st_mtime_ns
+    if mtime != _INDEX_CACHE['mtime']:
+        with open(INDEX_HTML_PATH, 'rb') as f:
+            data = f.read()
+        _INDEX_CACHE.update(mtime=mtime, data=data, etag=f'"{mtime:x}"')
+    return _INDEX_CACHE['data'], _INDEX_CACHE['etag']
+
+
+# Cap in-flight requests; ThreadingMixIn spawns a thread per connection
+# and the proxy endpoints can hold theirs for up to 10s
+_REQUEST_SLOTS = threading.BoundedSemaphore(32)
+
+
+class StatsHandler(BaseHTTPRequestHandler):
+    # HTTP/1.1 keeps the TLS connection alive between polls, sparing the
+    # browser a TCP + TLS handshake every 5 seconds. Requires every
+    # response to carry Content-Length - always reply via send_body().
+    protocol_version = 'HTTP/1.1'
+
+    # TCP_NODELAY: small JSON responses shouldn't sit in Nagle's buffer
+    # waiting for an ACK on a kept-alive connection
+    disable_nagle_algorithm = True
+
+    def send_body(self, payload, status=200, content_type='application/json',
+                  extra_headers=None):
+        """Send a complete response with Content-Length set"""
+        self.send_response(status)
+        self.send_header('Content-Type', content_type)
+        self.send_header('Access-Control-Allow-Origin', '*')
+        if extra_headers:
+            for name, value in extra_headers:
+                self.send_header(name, value)
+        self.send_header('Content-Length', str(len(payload)))
+        self.end_headers()
+        if payload:
+            self.wfile.write(payload)
+
+    def check_auth(self):
+        """Check HTTP Basic Authentication using PAM"""
+        if not PAM_AVAILABLE:
+            print("PAM not available - allowing access")
+            return True
+        
+        auth_header = self.headers.get('Authorization')
         if not auth_header:
             print("No Authorization header provided")
             return False
-        
+
+        cache_key = hashlib.blake2b(auth_header.encode(), digest_size=16,
+                                    key=_AUTH_CACHE_SECRET).digest()
+        now = time.time()
+        with _auth_cache_lock:
+            expiry = _AUTH_CACHE.get(cache_key)
+            if expiry is not None:
+                if expiry > now:
+                    _AUTH_CACHE.move_to_end(cache_key)
+                    return True
+                del _AUTH_CACHE[cache_key]
+
         try:
             auth_type, credentials = auth_header.split(' ', 1)
             if auth_type.lower() != 'basic':
                 print(f"Wrong auth type: {auth_type}")
                 return False
-            
+
             decoded = base64.b64decode(credentials).decode('utf-8')
             username, password = decoded.split(':', 1)
-            
+
             print(f"Attempting PAM authentication for user: {username}")
             p = pam.pam()
             result = p.authenticate(username, password)
-            
+
             if result:
                 print(f"✓ Authentication successful for user: {username}")
+                with _auth_cache_lock:
+                    _AUTH_CACHE[cache_key] = now + AUTH_CACHE_TTL
+                    _AUTH_CACHE.move_to_end(cache_key)
+                    while len(_AUTH_CACHE) > AUTH_CACHE_MAX:
+                        _AUTH_CACHE.popitem(last=False)
             else:
                 print(f"✗ Authentication failed for user: {username}")
-            
+
             return result
         except Exception as e:
             print(f"Authentication error: {e}")
@@ -427,280 +1528,234 @@ class StatsHandler(BaseHTTPRequestHandler):
     
     def require_auth(self):
         """Send 401 Unauthorized response"""
-        self.send_response(401)
-        self.send_header('WWW-Authenticate', 'Basic realm="Pi5 NVR Dashboard"')
-        self.send_header('Content-Type', 'text/html')
-        self.end_headers()
-        self.wfile.write(b'<html><body><h1>401 Unauthorized</h1></body></html>')
+        self.send_body(b'<html><body><h1>401 Unauthorized</h1></body></html>',
+                       status=401, content_type='text/html',
+                       extra_headers=[('WWW-Authenticate', 'Basic realm="Pi5 NVR Dashboard"')])
     
     def do_GET(self):
-        # Allow favicon without authentication
-        if self.path in ['/favicon.svg', '/favicon.ico']:
-            self.send_response(200)
-            self.send_header('Content-Type', 'image/svg+xml')
-            self.send_header('Cache-Control', 'public, max-age=3600')
-            self.end_headers()
-            
-            favicon_svg = '''<svg xmlns="http://www.w3.org/2000/svg" viewBox="0 0 100 100">
-                <defs>
-                    <linearGradient id="g" x1="0%" y1="0%" x2="100%" y2="100%">
-                        <stop offset="0%" style="stop-color:#2196F3"/>
-                        <stop offset="100%" style="stop-color:#1976D2"/>
-                    </linearGradient>
-                </defs>
-                <circle cx="50" cy="50" r="48" fill="url(#g)"/>
-                <text x="50" y="73" font-family="Georgia,serif" font-size="70" font-weight="bold" fill="white" text-anchor="middle">π</text>
-            </svg>'''
-            self.wfile.write(favicon_svg.encode())
+        # Bound concurrent work so a burst of slow proxy calls can't
+        # spawn an unbounded pile of busy threads
+        with _REQUEST_SLOTS:
+            self._handle_get()
+
+    def _get_favicon(self):
+        self.send_body(FAVICON_BYTES, content_type='image/svg+xml',
+                       extra_headers=[('Cache-Control', 'public, max-age=3600, immutable')])
+
+    def _get_hardware(self):
+        self.send_body(json.dumps(detect_hardware()).encode())
+
+    def _get_storage_devices(self):
+        devices = get_storage_devices()
+        self.send_body(json.dumps({'devices': devices}).encode())
+
+    def _get_stats(self):
+        if 'gzip' in self.headers.get('Accept-Encoding', ''):
+            self.send_body(get_system_stats_json(gzipped=True),
+                           extra_headers=[('Content-Encoding', 'gzip')])
+        else:
+            self.send_body(get_system_stats_json())
+
+    def _get_container_logs(self):
+        query = parse_qs(self.path.partition('?')[2])
+        container = query.get('container', [''])[0]
+        self.stream_container_logs(container)
+
+    def _get_index(self):
+        page, etag = get_index_html()
+        if self.headers.get('If-None-Match') == etag:
+            self.send_body(b'', status=304, extra_headers=[('ETag', etag)])
             return
-        
-        # Check authentication for all other requests
-        if not self.check_auth():
+        self.send_body(page, content_type='text/html',
+                       extra_headers=[('ETag', etag)])
+
+    # Dict dispatch on the query-stripped path replaces the old if/elif
+    # ladder; adding an endpoint is one entry here plus its method
+    _GET_ROUTES = {
+        '/favicon.svg': _get_favicon,
+        '/favicon.ico': _get_favicon,
+        '/api/hardware': _get_hardware,
+        '/api/backup/status': lambda self: self.proxy_to_backup_api('/api/backup/status'),
+        '/api/backup/log': lambda self: self.proxy_to_backup_api('/api/backup/log'),
+        '/api/backup/list': lambda self: self.proxy_to_backup_api('/api/backup/list'),
+        '/api/backup/stats': lambda self: self.proxy_to_backup_api('/api/backup/stats'),
+        '/api/storage/devices': _get_storage_devices,
+        '/api/stats': _get_stats,
+        '/api/container/logs': _get_container_logs,
+        '/': _get_index,
+        '/index.html': _get_index,
+    }
+
+    # Favicon is fetched by browsers before credentials are entered
+    _NO_AUTH_PATHS = frozenset(['/favicon.svg', '/favicon.ico'])
+
+    def _handle_get(self):
+        path = self.path.partition('?')[0]
+
+        if path not in self._NO_AUTH_PATHS and not self.check_auth():
             self.require_auth()
             return
-        
-        if self.path == '/api/hardware':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            hardware = detect_hardware()
-            self.wfile.write(json.dumps(hardware).encode())
-            
-        elif self.path == '/api/backup/status':
-            self.proxy_to_backup_api('/api/backup/status')
-            
-        elif self.path == '/api/backup/log':
-            self.proxy_to_backup_api('/api/backup/log')
-        
-        elif self.path == '/api/backup/list':
-            self.proxy_to_backup_api('/api/backup/list')
-        
-        elif self.path == '/api/backup/stats':
-            self.proxy_to_backup_api('/api/backup/stats')
-
-        elif self.path == '/api/storage/devices':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            devices = self.get_storage_devices()
-            self.wfile.write(json.dumps({'devices': devices}).encode())
-            
-        elif self.path == '/api/stats':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            stats = self.get_system_stats()
-            self.wfile.write(json.dumps(stats).encode())
-            
-        elif self.path.startswith('/api/container/logs'):
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            
-            from urllib.parse import urlparse, parse_qs
-            query = parse_qs(urlparse(self.path).query)
-            container = query.get('container', [''])[0]
-            
-            result = self.get_container_logs(container)
-            self.wfile.write(json.dumps(result).encode())
-            
-        elif self.path == '/' or self.path == '/index.html':
-            self.send_response(200)
-            self.send_header('Content-Type', 'text/html')
-            self.end_headers()
-            
-            with open('/app/index.html', 'r') as f:
-                self.wfile.write(f.read().encode())
+
+        handler = self._GET_ROUTES.get(path)
+        if handler:
+            handler(self)
         else:
-            self.send_response(404)
-            self.end_headers()
-    
+            self.send_body(b'', status=404)
+
     def proxy_to_backup_api(self, path):
-        """Proxy request to backup API"""
+        """Proxy request to backup API, streaming the body through"""
         try:
-            import urllib.request
-            
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            
-            auth_header = self.headers.get('Authorization', '')
-            req = urllib.request.Request(
-                f'https://172.17.0.1:8081{path}',
-                headers={'Authorization': auth_header}
+            response = backup_api_stream(
+                'GET', path,
+                auth_header=self.headers.get('Authorization', '')
             )
-            
-            with urllib.request.urlopen(req, timeout=5, context=ctx) as response:
-                data = response.read()
-                
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(data)
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': str(e)}).encode())
+            self.send_body(json.dumps({'error': str(e)}).encode(), status=500)
+            return
+        self._stream_response(response)
+
+    def _stream_response(self, response):
+        """Copy an upstream http.client response to the client in 64 KiB
+        pieces instead of buffering the whole body first"""
+        self.send_response(response.status)
+        self.send_header('Content-Type',
+                         response.getheader('Content-Type', 'application/json'))
+        self.send_header('Access-Control-Allow-Origin', '*')
+        length = response.getheader('Content-Length')
+        try:
+            if length is not None:
+                self.send_header('Content-Length', length)
+                self.end_headers()
+                shutil.copyfileobj(response, self.wfile, length=65536)
+            else:
+                self.send_header('Transfer-Encoding', 'chunked')
+                self.end_headers()
+                chunk = response.read(65536)
+                while chunk:
+                    self._write_chunk(chunk)
+                    chunk = response.read(65536)
+                self._write_chunk(b'')
+        except OSError:
+            # Client went away mid-copy; the upstream response is only
+            # partially consumed, so this thread's connection is tainted
+            backup_conn_reset()
     
     def do_POST(self):
-        if not self.check_auth():
-            self.require_auth()
-            return
-        
-        content_length = self.headers.get('Content-Length')
-        body = self.rfile.read(int(content_length)).decode() if content_length else ''
-            
-        if self.path == '/api/backup':
-            self.proxy_post_to_backup_api('/api/backup', body)
-            
-        elif self.path == '/api/restore':
-            self.proxy_post_to_backup_api('/api/restore', body)
-            
-        elif self.path == '/api/backup/delete':
-            self.proxy_post_to_backup_api('/api/backup/delete', body)
-
-        elif self.path == '/api/storage/mount':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                data = json.loads(body) if body else {}
-                mountpoint = data.get('mountpoint', '/mnt/backup-ssd')
-                if not mountpoint.startswith('/mnt/'):
-                    self.wfile.write(json.dumps({'success': False, 'message': 'Mountpoint not allowed'}).encode())
-                    return
+        with _REQUEST_SLOTS:
+            self._handle_post()
+
+    def _post_storage_mount(self, body):
+        try:
+            data = json.loads(body) if body else {}
+            mountpoint = data.get('mountpoint', '/mnt/backup-ssd')
+            if not mountpoint.startswith('/mnt/'):
+                response = {'success': False, 'message': 'Mountpoint not allowed'}
+            else:
                 result = subprocess.run(['mount', mountpoint], capture_output=True, text=True, timeout=5)
                 if result.returncode == 0:
-                    self.wfile.write(json.dumps({'success': True, 'mountpoint': mountpoint}).encode())
+                    response = {'success': True, 'mountpoint': mountpoint}
                 else:
-                    self.wfile.write(json.dumps({'success': False, 'message': result.stderr or 'mount failed', 'code': result.returncode}).encode())
-            except Exception as e:
-                self.wfile.write(json.dumps({'success': False, 'message': str(e)}).encode())
-
-        elif self.path == '/api/storage/umount':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            try:
-                data = json.loads(body) if body else {}
-                mountpoint = data.get('mountpoint')
-                if not mountpoint or not mountpoint.startswith('/mnt/'):
-                    self.wfile.write(json.dumps({'success': False, 'message': 'Mountpoint not allowed'}).encode())
-                    return
+                    response = {'success': False, 'message': result.stderr or 'mount failed', 'code': result.returncode}
+        except Exception as e:
+            response = {'success': False, 'message': str(e)}
+        self.send_body(json.dumps(response).encode())
+
+    def _post_storage_umount(self, body):
+        try:
+            data = json.loads(body) if body else {}
+            mountpoint = data.get('mountpoint')
+            if not mountpoint or not mountpoint.startswith('/mnt/'):
+                response = {'success': False, 'message': 'Mountpoint not allowed'}
+            else:
                 result = subprocess.run(['umount', mountpoint], capture_output=True, text=True, timeout=5)
                 if result.returncode == 0:
-                    self.wfile.write(json.dumps({'success': True, 'mountpoint': mountpoint}).encode())
+                    response = {'success': True, 'mountpoint': mountpoint}
                 else:
-                    self.wfile.write(json.dumps({'success': False, 'message': result.stderr or 'umount failed', 'code': result.returncode}).encode())
-            except Exception as e:
-                self.wfile.write(json.dumps({'success': False, 'message': str(e)}).encode())
-        
-        elif self.path == '/api/restart':
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            
-            result = self.restart_system()
-            self.wfile.write(json.dumps(result).encode())
-            
-        elif self.path in ['/api/container/restart', '/api/container/stop', '/api/container/start']:
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            
-            data = json.loads(body) if body else {}
-            container = data.get('container', '')
-            action = self.path.split('/')[-1]
-            
-            result = self.control_container(container, action)
-            self.wfile.write(json.dumps(result).encode())
-            
+                    response = {'success': False, 'message': result.stderr or 'umount failed', 'code': result.returncode}
+        except Exception as e:
+            response = {'success': False, 'message': str(e)}
+        self.send_body(json.dumps(response).encode())
+
+    def _post_restart(self, body):
+        result = self.restart_system()
+        self.send_body(json.dumps(result).encode())
+
+    def _post_container_action(self, body):
+        data = json.loads(body) if body else {}
+        container = data.get('container', '')
+        action = self.path.split('/')[-1]
+
+        result = self.control_container(container, action)
+        self.send_body(json.dumps(result).encode())
+
+    _POST_ROUTES = {
+        '/api/backup': lambda self, body: self.proxy_post_to_backup_api('/api/backup', body),
+        '/api/restore': lambda self, body: self.proxy_post_to_backup_api('/api/restore', body),
+        '/api/backup/delete': lambda self, body: self.proxy_post_to_backup_api('/api/backup/delete', body),
+        '/api/storage/mount': _post_storage_mount,
+        '/api/storage/umount': _post_storage_umount,
+        '/api/restart': _post_restart,
+        '/api/container/restart': _post_container_action,
+        '/api/container/stop': _post_container_action,
+        '/api/container/start': _post_container_action,
+    }
+
+    def _handle_post(self):
+        if not self.check_auth():
+            self.require_auth()
+            return
+
+        content_length = self.headers.get('Content-Length')
+        body = self.rfile.read(int(content_length)).decode() if content_length else ''
+
+        handler = self._POST_ROUTES.get(self.path.partition('?')[0])
+        if handler:
+            handler(self, body)
         else:
-            self.send_response(404)
-            self.end_headers()
+            self.send_body(b'', status=404)
     
     def proxy_post_to_backup_api(self, path, body):
-        """Proxy POST request to backup API"""
+        """Proxy POST request to backup API, streaming the body through"""
         try:
-            import urllib.request
-            
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            
-            auth_header = self.headers.get('Authorization', '')
-            req = urllib.request.Request(
-                f'https://172.17.0.1:8081{path}',
-                data=body.encode() if body else None,
-                headers={
-                    'Content-Type': 'application/json',
-                    'Authorization': auth_header
-                }
+            response = backup_api_stream(
+                'POST', path,
+                body=body.encode() if body else b'',
+                auth_header=self.headers.get('Authorization', ''),
+                timeout=10
             )
-            
-            with urllib.request.urlopen(req, timeout=10, context=ctx) as response:
-                data = response.read()
-                
-            self.send_response(200)
-            self.send_header('Content-Type', 'application/json')
-            self.send_header('Access-Control-Allow-Origin', '*')
-            self.end_headers()
-            self.wfile.write(data)
         except Exception as e:
-            self.send_response(500)
-            self.send_header('Content-Type', 'application/json')
-            self.end_headers()
-            self.wfile.write(json.dumps({'error': str(e)}).encode())
+            self.send_body(json.dumps({'error': str(e)}).encode(), status=500)
+            return
+        self._stream_response(response)
 
     def get_backup_stats(self):
         """Get backup statistics from backup API"""
         try:
-            import urllib.request
-            from datetime import datetime
-            
-            ctx = ssl.create_default_context()
-            ctx.check_hostname = False
-            ctx.verify_mode = ssl.CERT_NONE
-            
-            auth_header = self.headers.get('Authorization', '')
-            req = urllib.request.Request(
-                'https://172.17.0.1:8081/api/backup/list',
-                headers={'Authorization': auth_header}
+            raw = backup_api_request(
+                'GET', '/api/backup/list',
+                auth_header=self.headers.get('Authorization', '')
             )
-            
-            with urllib.request.urlopen(req, timeout=5, context=ctx) as response:
-                data = json.loads(response.read().decode())
-            
+            data = json.loads(raw)
+
             if 'backups' in data:
                 backups = data['backups']
                 total_count = len(backups)
-                
-                # Find most recent backup by parsing filenames
+
+                # Latest timestamp and total size in one pass - no need
+                # to sort a copy of the whole list just to pick the max
                 last_backup = None
-                if backups:
-                    # Sort by timestamp in filename
-                    sorted_backups = sorted(backups, key=lambda b: b.get('timestamp', ''), reverse=True)
-                    if sorted_backups:
-                        last_backup = sorted_backups[0].get('timestamp', 'Unknown')
-                
-                # Calculate total size
-                total_size = sum(b.get('size', 0) for b in backups)
-                
+                total_size = 0
+                for b in backups:
+                    ts = b.get('timestamp', '')
+                    if last_backup is None or ts > last_backup:
+                        last_backup = ts
+                    total_size += b.get('size', 0)
+
                 return {
                     'total_count': total_count,
                     'last_backup': last_backup,
                     'total_size_bytes': total_size,
-                    'total_size': f"{total_size / (1024**3):.2f} GB" if total_size > 0 else "0 GB"
+                    'total_size': _fmt_gb2(total_size * _GB) if total_size > 0 else "0 GB"
                 }
             else:
                 return {'total_count': 0, 'last_backup': None, 'total_size': '0 GB'}
@@ -718,458 +1773,118 @@ class StatsHandler(BaseHTTPRequestHandler):
     def control_container(self, container_name, action):
         """Control a Docker container"""
         try:
-            result = subprocess.run(
-                ['docker', action, container_name],
-                capture_output=True, text=True, timeout=10
+            status, body = docker_api_request(
+                'POST', f'/containers/{container_name}/{action}', timeout=10
             )
-            
-            if result.returncode == 0:
+
+            if status in (204, 304):
                 return {'success': True, 'message': f'Container {action}ed successfully'}
             else:
-                return {'success': False, 'message': result.stderr or 'Command failed'}
+                try:
+                    message = json.loads(body).get('message', 'Command failed')
+                except ValueError:
+                    message = 'Command failed'
+                return {'success': False, 'message': message}
         except Exception as e:
             return {'success': False, 'message': str(e)}
-    
-    def get_container_logs(self, container_name):
-        """Get container logs"""
+
+    def _write_chunk(self, data):
+        """Emit one HTTP/1.1 chunked-transfer frame (b'' terminates)"""
+        self.wfile.write(f'{len(data):X}\r\n'.encode() + data + b'\r\n')
+
+    def stream_container_logs(self, container_name):
+        """Stream container logs to the client as chunked plain text.
+
+        The Engine API response is copied through frame by frame instead
+        of being buffered into a 500-line string and JSON-escaped, so a
+        chatty container never costs megabytes of intermediate copies.
+        """
         try:
-            result = subprocess.run(
-                ['docker', 'logs', '--tail', '500', container_name],
-                capture_output=True, text=True, timeout=5
+            response = docker_api_stream(
+                'GET',
+                f'/containers/{container_name}/logs?stdout=1&stderr=1&tail=500'
             )
-            
-            if result.returncode == 0:
-                return {'success': True, 'logs': result.stdout + result.stderr}
-            else:
-                return {'success': False, 'message': result.stderr, 'logs': ''}
         except Exception as e:
-            return {'success': False, 'message': str(e), 'logs': ''}
+            self.send_body(str(e).encode(), status=500,
+                           content_type='text/plain; charset=utf-8')
+            return
 
-    def get_system_stats(self):
-        """Gather all system statistics with caching"""
-        global STATS_CACHE
-        current_time = time.time()
-        
-        if 'timestamp' in STATS_CACHE and (current_time - STATS_CACHE['timestamp']) < CACHE_DURATION:
-            return STATS_CACHE['data']
-        
-        hardware = detect_hardware()
-        
-        stats = {
-            'hardware': hardware,
-            'cpu': self.get_cpu_stats(),
-            'memory': self.get_memory_stats(),
-            'disk': self.get_disk_stats(hardware),
-            'storage_devices': self.get_storage_devices(),
-            'network': self.get_network_stats(),
-            'system': self.get_system_info(),
-            'backup_config': {
-                'default_path': BACKUP_DEFAULT_PATH,
-                'nvme_path': NVME_BACKUP_PATH,
-                'usb_path': USB_BACKUP_PATH
-            }
-        }
-        
-        if hardware['docker']:
-            stats['docker'] = self.get_docker_stats()
-        
-        if hardware['hailo']:
-            stats['hailo'] = self.get_hailo_stats()
-        
-        if hardware['scrypted'] and SCRYPTED_AVAILABLE:
-            stats['scrypted'] = get_all_scrypted_stats()
-        
-        STATS_CACHE = {'timestamp': current_time, 'data': stats}
-        return stats
-    
-    def get_cpu_stats(self):
-        """Get CPU stats"""
-        try:
-            with open('/host/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-                temp = float(f.read().strip()) / 1000.0
-        except:
-            temp = 0.0
-        
-        cpu_percent = psutil.cpu_percent(interval=None)
-        per_core = psutil.cpu_percent(interval=None, percpu=True)
-        if cpu_percent == 0.0:
-            cpu_percent = psutil.cpu_percent(interval=0.1)
-            per_core = psutil.cpu_percent(interval=0.1, percpu=True)
-        
-        load_avg = os.getloadavg()
-        
-        return {
-            'temperature': f"{temp:.1f}",
-            'usage': cpu_percent,
-            'per_core': per_core,
-            'load_avg': f"{load_avg[0]:.2f} {load_avg[1]:.2f} {load_avg[2]:.2f}"
-        }
-    
-    def get_memory_stats(self):
-        """Get memory stats"""
-        mem = psutil.virtual_memory()
-        return {
-            'total': f"{mem.total / (1024**3):.1f} GB",
-            'used': f"{mem.used / (1024**3):.1f} GB",
-            'available': f"{mem.available / (1024**3):.1f} GB",
-            'percent': mem.percent
-        }
-    
-    def get_disk_stats(self, hardware):
-        """Get disk stats based on available hardware"""
-        result = {}
-        
-        # Boot device stats
-        boot_device = hardware['boot_device']
-        root_usage = psutil.disk_usage('/')
-        
-        if boot_device == 'nvme' and hardware['nvme']:
-            result['nvme'] = {
-                'total': f"{root_usage.total / (1024**3):.1f} GB",
-                'used': f"{root_usage.used / (1024**3):.1f} GB",
-                'available': f"{root_usage.free / (1024**3):.1f} GB",
-                'percent': root_usage.percent,
-                'boot': True
-            }
-        elif boot_device == 'sd' and hardware['sd_card']:
-            result['sd_card'] = {
-                'total': f"{root_usage.total / (1024**3):.1f} GB",
-                'used': f"{root_usage.used / (1024**3):.1f} GB",
-                'available': f"{root_usage.free / (1024**3):.1f} GB",
-                'percent': root_usage.percent,
-                'boot': True
-            }
-        
-        # USB SSD backup drive
-        if hardware['usb_ssd']:
+        if response.status != 200:
+            body = response.read()
             try:
-                usb_usage = psutil.disk_usage('/mnt/backup-ssd')
-                result['usb_ssd'] = {
-                    'total': f"{usb_usage.total / (1024**3):.1f} GB",
-                    'used': f"{usb_usage.used / (1024**3):.1f} GB",
-                    'available': f"{usb_usage.free / (1024**3):.1f} GB",
-                    'percent': usb_usage.percent,
-                    'mounted': True
-                }
-            except:
-                result['usb_ssd'] = {'mounted': False}
-        
-        # SD card (if not boot device but present)
-        if hardware['sd_card'] and boot_device != 'sd':
-            # Find SD card partitions and get total size
-            try:
-                import subprocess
-                # Try different device paths
-                device_path = None
-                for path in ['/dev/mmcblk0', '/host/dev/mmcblk0']:
-                    if os.path.exists(path):
-                        device_path = path
-                        break
-                
-                if not device_path:
-                    result['sd_card'] = {'present': True, 'accessible': False}
-                else:
-                    # Get full SD card size and partition info
-                    lsblk_result = subprocess.run(
-                        ['lsblk', '-b', '-o', 'NAME,SIZE,MOUNTPOINT', device_path],
-                        capture_output=True, text=True, timeout=5
-                    )
-                    
-                    if lsblk_result.returncode == 0:
-                        lines = lsblk_result.stdout.strip().split('\n')
-                        total_size = 0
-                        used_size = 0
-                        
-                        # Parse lsblk output (skip header line)
-                        for i, line in enumerate(lines[1:], 1):
-                            # Clean up tree characters (├─, └─, etc.)
-                            clean_line = line.replace('├─', '').replace('└─', '').replace('│ ', '')
-                            parts = clean_line.split()
-                            
-                            if len(parts) >= 2:
-                                # First data line is the main device - get total size
-                                if i == 1:
-                                    try:
-                                        total_size = int(parts[1])
-                                    except (ValueError, IndexError):
-                                        pass
-                                
-                                # Check if partition has a mountpoint
-                                if len(parts) >= 3:
-                                    mount = parts[2]
-                                    try:
-                                        usage = psutil.disk_usage(mount)
-                                        used_size += usage.used
-                                    except:
-                                        pass
-                        
-                        if total_size > 0:
-                            available_size = total_size - used_size
-                            percent = (used_size / total_size) * 100 if total_size > 0 else 0
-                            
-                            result['sd_card'] = {
-                                'total': f"{total_size / (1024**3):.1f} GB",
-                                'used': f"{used_size / (1024**3):.1f} GB",
-                                'available': f"{available_size / (1024**3):.1f} GB",
-                                'percent': round(percent, 1),
-                                'boot': False
-                            }
-                        else:
-                            result['sd_card'] = {'present': True, 'mounted': False}
-                    else:
-                        result['sd_card'] = {'present': True, 'mounted': False, 'error': lsblk_result.stderr}
-            except Exception as e:
-                result['sd_card'] = {'present': True, 'error': str(e)}
-        
-        return result
-    
-    def get_network_stats(self):
-        """Get network stats"""
-        detected_container_ip = auto_detect_ip()
-
-        route_ip, route_source, route_gw, route_subnet, route_iface = host_ip_via_route()
-        if not route_ip:
-            route_ip, route_source, route_gw, route_subnet, route_iface = host_ip_from_proc_route()
-        proc_ip, proc_source, proc_gw, proc_subnet = host_ip_from_proc()
-        nsenter_ip, nsenter_source, nsenter_gw, nsenter_subnet = host_ip_from_nsenter()
-
-        host_ip = IP_OVERRIDE or route_ip or proc_ip or nsenter_ip or detected_container_ip or 'Unknown'
-        gw = route_gw or proc_gw or nsenter_gw
-        subnet = route_subnet or proc_subnet or nsenter_subnet
-
-        # Determine assignment source
-        if IP_OVERRIDE:
-            assignment = 'static (override)'
-        elif route_source:
-            assignment = route_source
-        elif nsenter_source:
-            assignment = nsenter_source
-        elif proc_ip:
-            assignment = 'unknown'
-        else:
-            assignment = 'unknown'
-        
-        rx_bytes = 0
-        tx_bytes = 0
-        try:
-            for iface in ['eth0', 'wlan0', 'end0']:
-                try:
-                    with open(f'/host/sys/class/net/{iface}/statistics/rx_bytes', 'r') as f:
-                        rx_bytes += int(f.read().strip())
-                    with open(f'/host/sys/class/net/{iface}/statistics/tx_bytes', 'r') as f:
-                        tx_bytes += int(f.read().strip())
-                except:
-                    pass
-        except:
-            net_io = psutil.net_io_counters()
-            rx_bytes = net_io.bytes_recv
-            tx_bytes = net_io.bytes_sent
-        
-        config_block = {}
-        if STATIC_IP:
-            config_block['ip'] = STATIC_IP
-        if STATIC_GATEWAY:
-            config_block['gateway'] = STATIC_GATEWAY
-        if STATIC_SUBNET:
-            config_block['subnet'] = STATIC_SUBNET
-
-        suggested_env = None
-        if host_ip and host_ip != 'Unknown' and not IP_OVERRIDE:
-            suggested_env = f"DASHBOARD_IP_OVERRIDE={host_ip}"
-
-        container_name, container_id = _detect_container_identity()
-
-        return {
-            'ip': host_ip,
-            'container_ip': detected_container_ip or 'Unknown',
-            'container_name': container_name,
-            'container_id': container_id,
-            'rx': f"{rx_bytes / (1024**3):.2f} GB",
-            'tx': f"{tx_bytes / (1024**3):.2f} GB",
-            'config': config_block,
-            'assignment': assignment,
-            'dhcp': assignment == 'dhcp',
-            'gateway': gw,
-            'subnet': subnet,
-            'suggested_env': suggested_env,
-            'ports': {
-                'dashboard_https': 8443,
-                'backup_api_internal': 8081
-            }
-        }
+                message = json.loads(body).get('message', '')
+            except ValueError:
+                message = body.decode('utf-8', errors='replace')
+            self.send_body(message.encode(), status=response.status,
+                           content_type='text/plain; charset=utf-8')
+            return
 
-    def get_docker_stats(self):
-        """Get Docker stats"""
-        try:
-            # Map container names to IDs for display when names are not friendly elsewhere
-            id_lookup = {}
-            try:
-                ps_output = subprocess.run(
-                    ['docker', 'ps', '--no-trunc', '--format', '{{.Names}}|{{.ID}}'],
-                    capture_output=True, text=True, timeout=3
-                )
-                for line in ps_output.stdout.strip().split('\n'):
-                    if '|' in line:
-                        name, cid = line.split('|', 1)
-                        id_lookup[name] = cid
-            except Exception:
-                pass
+        self.send_response(200)
+        self.send_header('Content-Type', 'text/plain; charset=utf-8')
+        self.send_header('Access-Control-Allow-Origin', '*')
+        self.send_header('Transfer-Encoding', 'chunked')
+        self.end_headers()
 
-            result = subprocess.run(
-                ['docker', 'stats', '--no-stream', '--format', 
-                 '{{.Name}}|{{.CPUPerc}}|{{.MemUsage}}|{{.MemPerc}}|{{.NetIO}}|{{.BlockIO}}'],
-                capture_output=True, text=True, timeout=4
-            )
-            
-            if not result.stdout:
-                return {'containers': []}
-            
-            containers = []
-            for line in result.stdout.strip().split('\n'):
-                if not line:
-                    continue
-                    
-                parts = line.split('|')
-                if len(parts) >= 4:
-                    cid = id_lookup.get(parts[0])
-                    containers.append({
-                        'name': parts[0],
-                        'id': cid,
-                        'cpu': parts[1],
-                        'memory': parts[2],
-                        'mem_percent': parts[3],
-                        'network': parts[4] if len(parts) > 4 else 'N/A',
-                        'disk': parts[5] if len(parts) > 5 else 'N/A',
-                        'status': 'running'
-                    })
-            
-            return {'containers': containers}
-            
-        except Exception as e:
-            return {'containers': [], 'error': str(e)}
-
-    def get_hailo_stats(self):
-        """Get Hailo stats"""
-        stats = {
-            'device': 'Not found',
-            'driver': 'Not loaded',
-            'driver_version': 'N/A',
-            'pci_address': 'N/A',
-            'status': '❌ Inactive'
-        }
-        
         try:
-            for path in ['/host/dev/hailo0', '/dev/hailo0']:
-                if os.path.exists(path):
-                    stats['device'] = '/dev/hailo0'
-                    break
-            
-            try:
-                with open('/host/proc/modules', 'r') as f:
-                    for line in f:
-                        if 'hailo_pci' in line:
-                            parts = line.split()
-                            stats['driver'] = 'hailo_pci'
-                            stats['driver_version'] = parts[1] if len(parts) > 1 else 'Loaded'
-                            break
-            except:
-                pass
-            
-            if os.path.exists('/host/sys/bus/pci/devices'):
-                for pci_dev in os.listdir('/host/sys/bus/pci/devices'):
-                    vendor_path = f'/host/sys/bus/pci/devices/{pci_dev}/vendor'
-                    if os.path.exists(vendor_path):
-                        with open(vendor_path, 'r') as f:
-                            vendor = f.read().strip()
-                        if vendor == '0x1e60':
-                            stats['pci_address'] = pci_dev
-                            break
-            
-            if stats['device'] != 'Not found' and stats['driver'] != 'Not loaded':
-                stats['status'] = '✅ Active'
-            
-            return stats
+            # Non-TTY containers frame the stream: 1 byte type, 3 bytes
+            # padding, 4 bytes big-endian payload length
+            header = response.read(8)
+            if header and header[0] in (0, 1, 2):
+                while len(header) == 8:
+                    length = int.from_bytes(header[4:8], 'big')
+                    payload = response.read(length)
+                    if payload:
+                        self._write_chunk(payload)
+                    if len(payload) < length:
+                        break
+                    header = response.read(8)
+            else:
+                chunk = header
+                while chunk:
+                    self._write_chunk(chunk)
+                    chunk = response.read(65536)
+            self._write_chunk(b'')
+        except OSError:
+            # Client went away mid-stream; the Engine response wasn't
+            # fully consumed, so this thread's connection is tainted
+            docker_conn_reset()
 
-        def get_storage_devices(self):
-            """Enumerate storage devices and their mount status"""
-            devices = []
-            try:
-                lsblk = subprocess.run(
-                    ['lsblk', '-J', '-b', '-o', 'NAME,PATH,SIZE,TYPE,TRAN,MOUNTPOINT,MODEL,FSTYPE'],
-                    capture_output=True, text=True, timeout=5
-                )
-                if lsblk.returncode != 0:
-                    return {'error': lsblk.stderr.strip()}
-                data = json.loads(lsblk.stdout)
-                for blk in data.get('blockdevices', []):
-                    if blk.get('type') != 'disk':
-                        continue
-                    mountpoint = blk.get('mountpoint') or ''
-                    mounted = bool(mountpoint)
-                    # Suggested mountpoint for known roles
-                    suggested_mount = None
-                    if blk.get('tran') == 'usb':
-                        suggested_mount = '/mnt/backup-ssd'
-                    usage = None
-                    if mounted:
-                        try:
-                            u = psutil.disk_usage(mountpoint)
-                            usage = {
-                                'total': f"{u.total / (1024**3):.1f} GB",
-                                'used': f"{u.used / (1024**3):.1f} GB",
-                                'available': f"{u.free / (1024**3):.1f} GB",
-                                'percent': u.percent
-                            }
-                        except Exception:
-                            usage = None
-                    devices.append({
-                        'name': blk.get('name'),
-                        'path': blk.get('path'),
-                        'model': blk.get('model', '').strip(),
-                        'size': f"{int(blk.get('size', 0)) / (1024**3):.1f} GB" if blk.get('size') else '0 GB',
-                        'transport': blk.get('tran', ''),
-                        'fstype': blk.get('fstype', ''),
-                        'mounted': mounted,
-                        'mountpoint': mountpoint,
-                        'suggested_mount': suggested_mount,
-                        'usage': usage
-                    })
-            except Exception as e:
-                return {'error': str(e)}
-            return devices
-            
-        except Exception as e:
-            stats['status'] = f'Error: {str(e)}'
-            return stats
-    
-    def get_system_info(self):
-        """Get system info"""
-        uptime_seconds = int(psutil.boot_time())
-        uptime = str(timedelta(seconds=int(time.time() - uptime_seconds)))
-        
-        return {'uptime': uptime}
-    
     def log_message(self, format, *args):
         """Suppress HTTP request logging"""
         pass
 
+class ThreadedHTTPServer(ThreadingMixIn, HTTPServer):
+    """Handle each request in its own thread so slow proxy/subprocess
+    calls don't stall other clients"""
+    daemon_threads = True
+
+
 def run_server(port=8443):
     """Start the HTTPS server"""
+    # SIGHUP forces re-detection of the probe-once hardware
+    try:
+        signal.signal(signal.SIGHUP, lambda *_: _detect_static_hardware.cache_clear())
+    except (ValueError, OSError):
+        pass
+
+    # Seed the /proc/stat snapshot so the first usage delta is measured
+    # against startup rather than an empty baseline
+    global _LAST_CPU_TIMES
+    _LAST_CPU_TIMES = _read_proc_stat()
+
+    # Keep the stats cache warm so handlers only ever serve from memory
+    threading.Thread(target=stats_refresh_loop, daemon=True).start()
+
     server_address = ('', port)
-    httpd = HTTPServer(server_address, StatsHandler)
+    httpd = ThreadedHTTPServer(server_address, StatsHandler)
     
-    try:
-        context = ssl.SSLContext(ssl.PROTOCOL_TLS_SERVER)
-        context.load_cert_chain(
-            certfile='/etc/ssl/dashboard/server.crt',
-            keyfile='/etc/ssl/dashboard/server.key'
-        )
-        httpd.socket = context.wrap_socket(httpd.socket, server_side=True)
+    if SERVER_SSL_CONTEXT is not None:
+        httpd.socket = SERVER_SSL_CONTEXT.wrap_socket(httpd.socket, server_side=True)
         print(f"✓ HTTPS dashboard server running on port {port}")
         print(f"✓ Access at: https://192.168.178.31:{port}")
         print(f"✓ Authentication: Enabled (PAM)")
-    except Exception as e:
-        print(f"WARNING: SSL failed, falling back to HTTP: {e}")
+    else:
+        print("WARNING: SSL unavailable, falling back to HTTP")
         print(f"HTTP dashboard server running on port {port}")
     
     httpd.serve_forever()